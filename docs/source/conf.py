@@ -1,14 +1,6 @@
 # Configuration file for the Sphinx documentation builder.
 # Documentation: https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import os
-import sys
-
-sys.path.insert(0, os.path.abspath('../..'))
-
-# Debugging: Print sys.path to verify
-print("sys.path:", sys.path)
-
 # -- Project Information -----------------------------------------------------
 project = 'VITAL'
 copyright = (
@@ -20,16 +12,12 @@ release = '0.1'
 
 # -- General Configuration ---------------------------------------------------
 extensions = [
-    'sphinx.ext.autodoc',       # Automatically document Python modules
+    'autoapi.extension',        # Document Python modules by parsing the source (no imports needed)
     'sphinx.ext.napoleon',      # Support for Google-style and NumPy-style docstrings
     'sphinx.ext.viewcode',      # Add links to highlighted source code
     'sphinx.ext.mathjax',       # Render mathematical expressions using MathJax
-    'sphinx.ext.autosummary',   # Automatically generate summary tables
 ]
 
-autosummary_generate = True
-autosummary_imported_members = True
-
 templates_path = ['_templates']
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
@@ -39,21 +27,24 @@ html_static_path = []
 html_show_sourcelink = False
 
 
-# -- Autodoc Configuration ---------------------------------------------------
-autodoc_member_order = 'bysource'
-autodoc_default_options = {
-    'members': True,
-    'undoc-members': True,
-    'private-members': False,
-    'special-members': '__init__',
-    'show-inheritance': True,
-}
-autodoc_class_signature = "separated"
+# -- AutoAPI Configuration ---------------------------------------------------
+autoapi_type = 'python'
+autoapi_dirs = ['../../vital']
+autoapi_root = 'api_docs'
+autoapi_add_toctree_entry = False
+autoapi_member_order = 'bysource'
+autoapi_options = [
+    'members',
+    'undoc-members',
+    'show-inheritance',
+    'special-members',
+]
 
 # -- Napoleon Configuration --------------------------------------------------
 napoleon_google_docstring = True
 napoleon_numpy_docstring = True
 napoleon_include_init_with_doc = True
+napoleon_use_ivar = True
 napoleon_use_param = True
 napoleon_use_rtype = True
 add_module_names = False
@@ -72,14 +63,5 @@ mathjax3_config = {
     }
 }
 
-# -- Intersphinx Configuration ------------------------------------------------
-intersphinx_mapping = {
-    'python': ('https://docs.python.org/3', None),
-    'numpy': ('https://numpy.org/doc/stable', None),
-    'pandas': ('https://pandas.pydata.org/docs', None),
-    'scipy': ('https://docs.scipy.org/doc/scipy/reference', None),
-    'matplotlib': ('https://matplotlib.org/stable', None),
-}
-
 # -- Suppress Warnings --------------------------------------------------------
 suppress_warnings = ['toc.not_included']
\ No newline at end of file
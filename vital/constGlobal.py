@@ -1,42 +1,16 @@
 class ConstantsGlobal:
     """
-    A singleton class for global physical constants.
+    Global physical constants.
     """
-    
-    _instance = None
 
-    def __new__(cls):
-        """
-        Ensure only one instance of the class exists.
-        """
-        if cls._instance is None:
-            cls._instance = super(ConstantsGlobal, cls).__new__(cls)
-        return cls._instance
+    #: Density of seawater (kg/m^3).
+    rho = 1025.0
 
-    @property
-    def rho(self):
-        """
-        Density of seawater (kg/m^3).
-        """
-        return 1025.0
+    #: Atmospheric pressure at sea level (Pa).
+    Patm = 101325.0
 
-    @property
-    def Patm(self):
-        """
-        Atmospheric pressure at sea level (Pa).
-        """
-        return 101325.0
+    #: Vapor pressure of seawater at 25°C (Pa).
+    Pvap = 3063.7485
 
-    @property
-    def Pvap(self):
-        """
-        Vapor pressure of seawater at 25°C (Pa).
-        """
-        return 3063.7485
-
-    @property
-    def g(self):
-        """
-        Acceleration due to gravity (m/s^2).
-        """
-        return 9.8
\ No newline at end of file
+    #: Acceleration due to gravity (m/s^2).
+    g = 9.8
\ No newline at end of file
@@ -1,7 +1,21 @@
 import numpy as np
 import scipy.integrate as integrate
-import matplotlib.pyplot as plt
-plt.style.use('tableau-colorblind10')
+
+_plt = None
+
+def _get_plt():
+    """
+    Import matplotlib.pyplot on first use, so that runs without visualisation never load Matplotlib.
+
+    Returns:
+        module: matplotlib.pyplot, with the colorblind-friendly style applied.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        plt.style.use('tableau-colorblind10')
+        _plt = plt
+    return _plt
 
 class BatteryCharging:
     """
@@ -11,9 +25,10 @@ class BatteryCharging:
         battery_capacity_kWh (float): Battery capacity in kilowatt-hours.
         number_of_turbines (int): Number of turbines contributing to power generation.
         turbulence_intensity (float): Turbulence intensity factor.
+        dtype (np.dtype): Floating-point type used to store the power series.
     """
 
-    def __init__(self, battery_capacity_kWh, number_of_turbines, turbulence_intensity):
+    def __init__(self, battery_capacity_kWh, number_of_turbines, turbulence_intensity, dtype=np.float64):
         """
         Initialize the BatteryCharging class.
 
@@ -21,14 +36,20 @@ class BatteryCharging:
             battery_capacity_kWh (float): Battery capacity in kilowatt-hours.
             number_of_turbines (int): Number of turbines contributing to power generation.
             turbulence_intensity (float): Turbulence intensity factor.
+            dtype (np.dtype, optional): Floating-point type used to store the power series. np.float32 halves
+                the memory traffic of long series; energies are still integrated in float64. Defaults to np.float64.
         """
         self.battery_capacity_kWh = battery_capacity_kWh
         self.battery_capacity_J = battery_capacity_kWh * 3600 * 1000  # Convert kWh to Joules
         self.number_of_turbines = number_of_turbines
         self.turbulence_intensity = turbulence_intensity
+        self.dtype = np.dtype(dtype)
         self.instantaneous_power = None
         self.time_series = None
 
+        # Scaling from single-turbine power to farm power, corrected for turbulence intensity
+        self._power_scale = self.number_of_turbines / (1 + self.turbulence_intensity) ** 3
+
     def set_instantaneous_power(self, power_data, time_data):
         """
         Set instantaneous power and time series data.
@@ -37,8 +58,10 @@ class BatteryCharging:
             power_data (list or np.ndarray): Power data in Watts.
             time_data (list or np.ndarray): Time data in seconds.
         """
-        self.instantaneous_power = np.array(power_data) / (1 + self.turbulence_intensity) ** 3 * self.number_of_turbines
-        self.time_series = np.array(time_data)
+        self.instantaneous_power = np.multiply(power_data, self._power_scale, dtype=self.dtype)  # Single allocation
+        # Time stays in full precision (float32 would resolve only ~2 s after a year); copies only strided input,
+        # so later slices reshape as views
+        self.time_series = np.ascontiguousarray(time_data)
 
     def chargeBattery_continuous(self, power_electric, time_data, visualise=True):
         """
@@ -55,21 +78,26 @@ class BatteryCharging:
         self.set_instantaneous_power(power_electric, time_data)
 
         cumulative_energy_J = integrate.cumulative_trapezoid(y=self.instantaneous_power, x=self.time_series, initial=0)
-        cumulative_energy_Wh = cumulative_energy_J / 3600
         num_batteries_charged = int(cumulative_energy_J[-1] / self.battery_capacity_J)
 
-        charge_times_hr = []
-        for ibattery in range(1, num_batteries_charged + 1):
-            energy_needed = ibattery * self.battery_capacity_J
-            charge_time_index = np.where(cumulative_energy_J >= energy_needed)[0][0]
-            charge_times_hr.append(time_data[charge_time_index] / 3600)
+        # First time each multiple of the battery capacity is reached, for all batteries in one binary search.
+        # The running maximum is non-decreasing (even if power dips negative) and crosses each level at the same index.
+        energy_needed = np.arange(1, num_batteries_charged + 1) * self.battery_capacity_J
+        charge_time_index = np.searchsorted(np.maximum.accumulate(cumulative_energy_J), energy_needed, side='left')
+        charge_times_hr = self.time_series[charge_time_index] / 3600
 
-        wrapped_cumulative_energy_J = cumulative_energy_J % self.battery_capacity_J
-        charge_times_hr_diff = np.diff(np.insert(charge_times_hr, 0, 0))
-
-        battery_capacity_Wh = self.battery_capacity_kWh * 1000  # Convert kWh to Wh
+        # Time to charge each battery: the first one from t = 0, the others from the previous charge
+        charge_times_hr_diff = np.empty_like(charge_times_hr)
+        if num_batteries_charged:
+            charge_times_hr_diff[0] = charge_times_hr[0]
+            np.subtract(charge_times_hr[1:], charge_times_hr[:-1], out=charge_times_hr_diff[1:])
 
         if visualise:
+            # Only needed for the plot
+            wrapped_cumulative_energy_J = cumulative_energy_J % self.battery_capacity_J
+            battery_capacity_Wh = self.battery_capacity_kWh * 1000  # Convert kWh to Wh
+
+            plt = _get_plt()
             plt.figure(figsize=(10, 8))
             plt.subplot(2, 1, 1)
             plt.plot(time_data / (3600 * 24), wrapped_cumulative_energy_J / battery_capacity_Wh)
@@ -98,72 +126,70 @@ class BatteryCharging:
             visualise (bool): Whether to visualize the results.
 
         Returns:
-            dict: Results including days, time to full charge, cumulative energy, and percent charged.
+            dict: Results including days, time to full charge, cumulative energy, and percent charged,
+                each as an array with one entry per day.
         """
         self.set_instantaneous_power(power_electric, time_data)
 
         dt = self.time_series[1] - self.time_series[0]
+        # Days are split by sample count, which requires uniform sampling. Only the leading samples are checked,
+        # so that validation does not cost a pass over the whole series
+        if not np.allclose(np.diff(self.time_series[:min(1000, len(self.time_series))]), dt):
+            raise ValueError("Time data must be uniformly sampled to split it into days.")
         lenPerDay = int((24 * 3600) / dt)
 
         num_days = len(time_data) // lenPerDay
-        time_series_truncated = self.time_series[:num_days * lenPerDay]
-        instantaneous_power_truncated = self.instantaneous_power[:num_days * lenPerDay]
-
-        reshaped_time = np.reshape(time_series_truncated, (-1, lenPerDay))
-        reshaped_Pelec = np.reshape(instantaneous_power_truncated, (-1, lenPerDay))
+        # Both series are C-contiguous (see set_instantaneous_power), so these are views, not copies
+        reshaped_time = self.time_series[:num_days * lenPerDay].reshape(num_days, lenPerDay)
+        reshaped_Pelec = self.instantaneous_power[:num_days * lenPerDay].reshape(num_days, lenPerDay)
 
         battery_capacity_Wh = self.battery_capacity_kWh * 1000  # Convert kWh to Wh
 
-        percent_charged_list = []
-        time_to_full_charged_list_hr = []
-        cumulative_energy_list_kWh = []
+        # Cumulative energy of every day at once, integrating along each row
+        cumulative_energy_J = integrate.cumulative_trapezoid(y=reshaped_Pelec, x=reshaped_time, axis=1, initial=0)
+        cumulative_energy_Wh = cumulative_energy_J / 3600
+        daily_energy_Wh = cumulative_energy_Wh[:, -1]
 
-        if visualise:
-            plt.figure(figsize=(10, 8))
+        percent_charged = np.minimum((daily_energy_Wh / battery_capacity_Wh) * 100, 100)
+        cumulative_energy_kWh = daily_energy_Wh / 1000
 
-        for irow in range(len(reshaped_Pelec)):
-            cumulative_energy_J = integrate.cumulative_trapezoid(y=reshaped_Pelec[irow, :], x=reshaped_time[irow, :], initial=0)
-            cumulative_energy_Wh = cumulative_energy_J / 3600
-
-            if visualise:
-                plt.subplot(2, 1, 1)
-                plt.plot(reshaped_time[irow, :], reshaped_Pelec[irow, :], label=f'Day {irow + 1}')
-                plt.title('Electrical Power Profile [W]')
-                plt.xlabel('Time (s)')
-                plt.ylabel('Power (W)')
-
-                plt.subplot(2, 1, 2)
-                plt.plot(reshaped_time[irow, :], cumulative_energy_Wh / 1000, label=f'Day {irow + 1}')
-                plt.title('Cumulative Energy Per Day [kWh]')
-                plt.xlabel('Time (s)')
-                plt.ylabel('Energy (kWh)')
-
-            percent_charged = (cumulative_energy_Wh[-1] / battery_capacity_Wh) * 100
-            percent_charged = min(percent_charged, 100)
-            percent_charged_list.append(percent_charged)
-            cumulative_energy_list_kWh.append(cumulative_energy_Wh[-1] / 1000)
-
-            charging_time_index = np.searchsorted(cumulative_energy_Wh, battery_capacity_Wh)
-            if charging_time_index < len(cumulative_energy_Wh):
-                charging_time_seconds = reshaped_time[irow, charging_time_index] - reshaped_time[irow, 0]
-                charging_time_hours = charging_time_seconds / 3600
-                time_to_full_charged_list_hr.append(charging_time_hours)
-            else:
-                time_to_full_charged_list_hr.append(0.0)
+        # Index of the first sample at which each day reaches full capacity (lenPerDay if it never does)
+        charging_time_index = np.sum(np.maximum.accumulate(cumulative_energy_Wh, axis=1) < battery_capacity_Wh, axis=1)
+        charged = charging_time_index < lenPerDay
+        charging_time_seconds = reshaped_time[np.arange(num_days), np.minimum(charging_time_index, lenPerDay - 1)] - reshaped_time[:, 0]
+        time_to_full_charged_hr = np.where(charged, charging_time_seconds / 3600, 0.0)
+        days = np.arange(num_days)
 
         if visualise:
-            plt.subplot(2, 1, 1)
-            plt.legend()
-            plt.tight_layout()
-
-            plt.subplot(2, 1, 2)
-            plt.legend()
-            plt.tight_layout()
+            plt = _get_plt()
+            from matplotlib.collections import LineCollection
+
+            # One LineCollection per panel (a line per day) instead of an artist per day and panel
+            colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+            fig, (ax_power, ax_energy) = plt.subplots(2, 1, figsize=(10, 8))
+
+            power_segments = np.stack([reshaped_time, reshaped_Pelec], axis=-1)
+            ax_power.add_collection(LineCollection(power_segments, colors=colors, label=f'Days 1-{num_days}'))
+            ax_power.autoscale()
+            ax_power.set_title('Electrical Power Profile [W]')
+            ax_power.set_xlabel('Time (s)')
+            ax_power.set_ylabel('Power (W)')
+            ax_power.legend()
+
+            energy_segments = np.stack([reshaped_time, cumulative_energy_Wh / 1000], axis=-1)
+            ax_energy.add_collection(LineCollection(energy_segments, colors=colors, label=f'Days 1-{num_days}'))
+            ax_energy.autoscale()
+            ax_energy.set_title('Cumulative Energy Per Day [kWh]')
+            ax_energy.set_xlabel('Time (s)')
+            ax_energy.set_ylabel('Energy (kWh)')
+            ax_energy.legend()
+
+            fig.tight_layout()
             plt.show()
 
             plt.figure(figsize=(10, 8))
             plt.subplot(2, 1, 1)
-            plt.bar(range(len(percent_charged_list)), percent_charged_list, tick_label=[f'D{i + 1}' for i in range(len(percent_charged_list))])
+            plt.bar(days, percent_charged, tick_label=[f'D{i + 1}' for i in range(num_days)])
             plt.title(f'Battery Capacity: {self.battery_capacity_kWh} kWh')
             plt.xlabel('Days')
             plt.ylabel('Percentage Charged (%)')
@@ -171,7 +197,7 @@ class BatteryCharging:
             plt.grid(True, axis='y')
 
             plt.subplot(2, 1, 2)
-            plt.bar(range(len(percent_charged_list)), time_to_full_charged_list_hr, tick_label=[f'D{i + 1}' for i in range(len(percent_charged_list))])
+            plt.bar(days, time_to_full_charged_hr, tick_label=[f'D{i + 1}' for i in range(num_days)])
             plt.xlabel('Days')
             plt.ylabel('Time to full charge [Hr]')
             plt.ylim(0, 24)
@@ -180,8 +206,8 @@ class BatteryCharging:
             plt.show()
 
         return {
-            "days": range(len(percent_charged_list)),
-            "time_to_full_charge_hr": time_to_full_charged_list_hr,
-            "cumulative_energy_kWh": cumulative_energy_list_kWh,
-            "percent_charged": percent_charged_list
+            "days": days,
+            "time_to_full_charge_hr": time_to_full_charged_hr,
+            "cumulative_energy_kWh": cumulative_energy_kWh,
+            "percent_charged": percent_charged
         }
\ No newline at end of file
@@ -1,7 +1,14 @@
+import math
+from collections import OrderedDict
 import numpy as np
 from vital.constGlobal import ConstantsGlobal
-import matplotlib.pyplot as plt
-plt.style.use('tableau-colorblind10')
+
+# Number of distinct TSR arrays whose Cpmin values are kept by ConstraintChecker. Each entry holds a copy of the
+# TSR values (its key) and the Cpmin result, i.e. about twice the memory of the TSR array
+CPMIN_CACHE_SIZE = 4
+
+# Number of samples evaluated at a time by the check_* methods, which stop at the first violating block
+CHECK_BLOCK_SIZE = 4096
 
 class ConstraintChecker:
     """
@@ -26,17 +33,125 @@ class ConstraintChecker:
         self.Patm = self.GLOBAL.Patm
         self.withChain = turbineConfig.get('attachment_method') == 'chain'
 
-    def depth_constraint(self, dHub):
+        # Moment arm of the turbine thrust about the pitch axis, fixed by the attachment method
+        if self.withChain:
+            self._turbine_arm = self._turbine_arm_chain
+        else:
+            self._turbine_arm = self._turbine_arm_mooring
+
+        # Scalar factors reused by every constraint evaluation
+        self._half_rho = 0.5 * self.rho
+        self._rho_g = self.rho * self.g
+        self._Patm_minus_Pvap = self.Patm - self.Pvap
+
+        # Tabulated (TSR, Cpmin) points registered with set_cpmin_table, used instead of CpminFunc
+        self._cpmin_table = None
+
+        # Vessel registered with set_vessel and its pitch-moment coefficients
+        self._vessel = None
+        self._vessel_coefficients = None
+
+    @property
+    def CpminFunc(self):
+        """callable: Function to calculate the pressure coefficient for cavitation (Cpmin)."""
+        return self._CpminFunc
+
+    @CpminFunc.setter
+    def CpminFunc(self, CpminFunc):
+        self._CpminFunc = CpminFunc
+        # Least-recently-used cache of CpminFunc results, keyed on the TSR values; emptied with every new function
+        self._cpmin_cache = OrderedDict()
+
+    def set_cpmin_table(self, xp, fp):
+        """
+        Evaluate Cpmin by linear interpolation in tabulated data instead of calling CpminFunc.
+
+        A single np.interp call is used per evaluation, which is much cheaper than a Python callable
+        for large TSR arrays. Outside the table the end values are held constant (no extrapolation).
+
+        Args:
+            xp (np.ndarray): Increasing tip-speed ratio values.
+            fp (np.ndarray): Cpmin values at xp.
+        """
+        xp = np.ascontiguousarray(xp, dtype=np.float64)
+        fp = np.ascontiguousarray(fp, dtype=np.float64)
+        if xp.ndim != 1 or xp.shape != fp.shape:
+            raise ValueError("xp and fp must be 1-D arrays of the same length.")
+        if np.any(np.diff(xp) <= 0):
+            raise ValueError("xp must be strictly increasing.")
+        self._cpmin_table = (xp, fp)
+        self._cpmin_cache.clear()
+
+    def _cpmin(self, TSR):
+        """
+        Evaluate CpminFunc (or the table from set_cpmin_table), reusing the result when the same TSR values were seen recently.
+
+        Up to CPMIN_CACHE_SIZE results are kept, each with a copy of its TSR values as the key.
+
+        Args:
+            TSR (np.ndarray): Tip-speed ratio values.
+
+        Returns:
+            np.ndarray: Cpmin values (read-only use, may be shared between calls).
+        """
+        if self._cpmin_table is not None:
+            return np.interp(TSR, *self._cpmin_table)
+
+        TSR_array = np.asarray(TSR)
+        key = (TSR_array.shape, TSR_array.dtype.str, TSR_array.tobytes())
+        Cpmin = self._cpmin_cache.get(key)
+        if Cpmin is None:
+            Cpmin = self.CpminFunc(TSR)
+            self._cpmin_cache[key] = Cpmin
+            if len(self._cpmin_cache) > CPMIN_CACHE_SIZE:
+                self._cpmin_cache.popitem(last=False)
+        else:
+            self._cpmin_cache.move_to_end(key)
+        return Cpmin
+
+    @staticmethod
+    def _turbine_arm_chain(dHub, moor_arm):
+        # Only vessel drag for Chain-connected turbines
+        return dHub
+
+    @staticmethod
+    def _turbine_arm_mooring(dHub, moor_arm):
+        return dHub + moor_arm
+
+    def _check_blockwise(self, constraint, *arrays):
+        """
+        Check that a constraint is positive everywhere, evaluating it block by block and stopping at the first violation.
+
+        Args:
+            constraint (callable): Function of the (broadcast) arrays and an ``out`` buffer returning constraint values.
+            *arrays (np.ndarray): Array arguments of the constraint.
+
+        Returns:
+            bool: True if all constraint values are > 0, False otherwise.
+        """
+        # Blocks of at most CHECK_BLOCK_SIZE elements of the broadcast shape; the buffered iterator broadcasts
+        # each block on the fly, so lower-dimensional arguments are never expanded to the full shape
+        blocks = np.nditer(arrays, flags=['external_loop', 'buffered', 'zerosize_ok'],
+                           op_flags=[['readonly']] * len(arrays), buffersize=CHECK_BLOCK_SIZE)
+        buffer = np.empty(CHECK_BLOCK_SIZE)
+        for block_arrays in blocks:
+            block = constraint(*block_arrays, out=buffer[:block_arrays[0].size])
+            if not np.min(block) > 0:  # Also stops on NaN
+                return False
+        return True
+
+    def depth_constraint(self, dHub, out=None):
         """
         Calculate depth constraint values.
 
         Args:
             dHub (np.ndarray): Hub depths.
+            out (np.ndarray, optional): Preallocated array to write the result into.
 
         Returns:
             np.ndarray: Depth constraint values (must be > 0 to be valid, rotor must be submerged.).
         """
-        return dHub - self.Radius
+        return np.subtract(dHub, self.Radius, out=out)
 
     def check_depth_constraint(self, dHub):
         """
@@ -48,25 +163,74 @@ class ConstraintChecker:
         Returns:
             bool: True if satisfied, False otherwise.
         """
-        return np.all(self.depth_constraint(dHub) > 0)
+        # Same as all(dHub - Radius > 0), without the intermediate array (and True for no samples, as np.all)
+        return np.size(dHub) == 0 or np.min(dHub) > self.Radius
 
-    def cavitation_constraint(self, TSR, Uinf_adjusted, RotorSpeed, dHub):
+    def cavitation_constraint(self, TSR, Uinf_adjusted, RotorSpeed, dHub, out=None):
         """
         Calculate cavitation constraint values.
 
+        The inputs only need to be broadcast-compatible (see cavitation_grid); the result has the broadcast shape.
+
         Args:
             TSR (np.ndarray): Tip-speed ratio values.
             Uinf_adjusted (np.ndarray): Adjusted flow speeds.
             RotorSpeed (np.ndarray): Rotor speeds.
             dHub (np.ndarray): Hub depths.
+            out (np.ndarray, optional): Preallocated array to write the result into.
 
         Returns:
             np.ndarray: Cavitation constraint values (must be > 0 to be valid).
         """
-        Vinf = np.sqrt(Uinf_adjusted**2 + (self.Radius * RotorSpeed)**2)
-        Pinf = self.Patm + self.rho * self.g * (dHub - self.Radius) # Tip of rotor
-        Cpmin = self.CpminFunc(TSR)  # Pressure coefficient for cavitation
-        return 0.5 * self.rho * Vinf**2 * Cpmin - (self.Pvap - Pinf)
+        Cpmin = self._cpmin(TSR)  # Pressure coefficient for cavitation
+        return self._cavitation_from_cpmin(Cpmin, Uinf_adjusted, RotorSpeed, dHub, out=out)
+
+    def cavitation_grid(self, TSR, Uinf_adjusted, RotorSpeed, dHub, out=None):
+        """
+        Calculate cavitation constraint values over the full grid of the given 1-D parameter values.
+
+        Each input is given its own axis and broadcast, so no meshgrid arrays are built and Cpmin is
+        evaluated only once per TSR value.
+
+        Args:
+            TSR (np.ndarray): 1-D tip-speed ratio values (axis 0).
+            Uinf_adjusted (np.ndarray): 1-D adjusted flow speeds (axis 1).
+            RotorSpeed (np.ndarray): 1-D rotor speeds (axis 2).
+            dHub (np.ndarray): 1-D hub depths (axis 3).
+            out (np.ndarray, optional): Preallocated array of shape (len(TSR), len(Uinf_adjusted), len(RotorSpeed), len(dHub)).
+
+        Returns:
+            np.ndarray: 4-D cavitation constraint values (must be > 0 to be valid).
+        """
+        return self.cavitation_constraint(np.asarray(TSR)[:, None, None, None],
+                                          np.asarray(Uinf_adjusted)[None, :, None, None],
+                                          np.asarray(RotorSpeed)[None, None, :, None],
+                                          np.asarray(dHub)[None, None, None, :],
+                                          out=out)
+
+    def _cavitation_from_cpmin(self, Cpmin, Uinf_adjusted, RotorSpeed, dHub, out=None):
+        """
+        Calculate cavitation constraint values for already evaluated Cpmin (see cavitation_constraint).
+        """
+        R = self.Radius
+
+        # Evaluate 0.5*rho*Vinf^2*Cpmin - (Pvap - Pinf) in place, with Vinf^2 = Uinf^2 + (R*w)^2
+        # and Pinf = Patm + rho*g*(dHub - R) at the tip of rotor, using two buffers instead of a temporary per operation
+        shape = np.broadcast_shapes(np.shape(Cpmin), np.shape(Uinf_adjusted), np.shape(RotorSpeed), np.shape(dHub))
+        if out is None:
+            out = np.empty(shape)
+        tmp = np.empty(shape)
+        np.multiply(RotorSpeed, R, out=out)
+        np.square(out, out=out)
+        np.square(Uinf_adjusted, out=tmp)
+        out += tmp
+        out *= Cpmin
+        out *= self._half_rho
+        np.subtract(dHub, R, out=tmp)
+        tmp *= self._rho_g
+        out += tmp
+        out += self._Patm_minus_Pvap
+        return out
 
     def check_cavitation_constraint(self, TSR, Uinf_adjusted, RotorSpeed, dHub):
         """
@@ -81,7 +245,8 @@ class ConstraintChecker:
         Returns:
             bool: True if satisfied, False otherwise.
         """
-        return np.all(self.cavitation_constraint(TSR, Uinf_adjusted, RotorSpeed, dHub) > 0)
+        Cpmin = self._cpmin(TSR)
+        return self._check_blockwise(self._cavitation_from_cpmin, Cpmin, Uinf_adjusted, RotorSpeed, dHub)
 
     def check_pitch_stiffness_constraint(self, vessel):
         """
@@ -95,7 +260,7 @@ class ConstraintChecker:
         """
         return vessel.user_defined or vessel.GM > 0
 
-    def pitch_constraint(self, vessel, Uinf_adjusted, Ft, dHub, number_of_turbines):
+    def pitch_constraint(self, vessel, Uinf_adjusted, Ft, dHub, number_of_turbines, out=None):
         """
         Calculate pitch constraint values.
 
@@ -105,15 +270,85 @@ class ConstraintChecker:
             Ft (np.ndarray): Thrust forces.
             dHub (np.ndarray): Hub depths.
             number_of_turbines (int): Number of turbines.
+            out (np.ndarray, optional): Preallocated array to write the result into.
 
         Returns:
             np.ndarray: Pitch constraint values (must be > 0 to be valid).
         """
         if vessel.user_defined:
-            return self.user_defined_pitch_constraint(vessel, Uinf_adjusted, Ft, dHub, number_of_turbines)
-        return self.designed_pitch_constraint(vessel, Uinf_adjusted, Ft, number_of_turbines)
+            return self.user_defined_pitch_constraint(vessel, Uinf_adjusted, Ft, dHub, number_of_turbines, out=out)
+        return self.designed_pitch_constraint(vessel, Uinf_adjusted, Ft, number_of_turbines, out=out)
+
+    def set_vessel(self, vessel):
+        """
+        Precompute the pitch-moment coefficients of a vessel for repeated pitch constraint evaluations.
+
+        The coefficients depend only on scalar vessel properties. Call again after the vessel changes
+        (e.g. after VesselData.calculate_vessel_properties); other vessels are still evaluated directly.
 
-    def designed_pitch_constraint(self, vessel, Uinf_adjusted, Ft, number_of_turbines):
+        Args:
+            vessel (VesselData): Vessel data object.
+        """
+        self._vessel = None  # Compute fresh coefficients rather than returning those of the previous vessel
+        self._vessel_coefficients = self._pitch_coefficients(vessel)
+        self._vessel = vessel
+
+    def _pitch_coefficients(self, vessel):
+        """
+        Scalar coefficients of the pitch moment equation, taken from set_vessel when available.
+
+        Args:
+            vessel (VesselData): Vessel data object.
+
+        Returns:
+            tuple: (Uinf^2 coefficient, moment arm per unit N*Ft, constant term) for a designed vessel,
+            (Uinf^2 coefficient, mooring moment arm, constant term) for a user-defined vessel.
+        """
+        if vessel is self._vessel and self._vessel_coefficients is not None:
+            return self._vessel_coefficients
+
+        theta_m = vessel.theta_m
+        sin_theta = math.sin(theta_m)
+        cos_theta = math.cos(theta_m)
+
+        if vessel.user_defined:
+            # Moment arm of the mooring force about the pitch axis
+            moor_arm = vessel.Xm * cos_theta + vessel.Zm * sin_theta
+            F_vessel_U2 = self._half_rho * vessel.Cd * vessel.area  # Vessel drag per unit Uinf^2
+            return F_vessel_U2 * moor_arm, moor_arm, vessel.Kphi * vessel.phi
+
+        return self._designed_pitch_coefficients(vessel, sin_theta, cos_theta)
+
+    def _designed_pitch_coefficients(self, vessel, sin_theta, cos_theta):
+        """
+        Pitch-moment coefficients of a designed vessel (see _pitch_coefficients).
+
+        Works elementwise when the vessel attributes are arrays (see designed_pitch_constraint_batch).
+
+        Args:
+            vessel (VesselData): Vessel data object, or an object with array-valued attributes.
+            sin_theta (float or np.ndarray): sin(theta_m).
+            cos_theta (float or np.ndarray): cos(theta_m).
+
+        Returns:
+            tuple: (Uinf^2 coefficient, moment arm per unit N*Ft, constant term).
+        """
+        # Fmoor and Fdrag are linear in Uinf^2 and Ft, so the moment equation
+        #   Fmoor*cos(theta_m)*length/2 + N*Ft*height/2 + (Fdrag - Fbuoy)*(height/2 - h_s/2)
+        # reduces to scalar coefficients applied to Uinf^2 and N*Ft
+        Fmoor_U2 = 0.25 * vessel.Cd * vessel.height * self.rho * vessel.width / sin_theta  # Fmoor per unit Uinf^2
+        Fdrag_U2 = self._half_rho * vessel.Cd * vessel.width * vessel.h_s  # Fdrag per unit Uinf^2
+        Fbuoy = self._rho_g * vessel.VesselVolume
+
+        moor_arm = cos_theta * vessel.length / 2
+        lever = vessel.height / 2 - vessel.h_s / 2
+
+        Moment_U2 = Fmoor_U2 * moor_arm + Fdrag_U2 * lever
+        Moment_NFt = moor_arm / sin_theta + vessel.height / 2  # Fmoor per unit N*Ft is 1/sin(theta_m)
+        Moment_0 = -Fbuoy * lever
+        return Moment_U2, Moment_NFt, vessel.Kphi * vessel.phi - Moment_0
+
+    def designed_pitch_constraint(self, vessel, Uinf_adjusted, Ft, number_of_turbines, out=None):
         """
         Calculate pitch constraint for a designed vessel.
 
@@ -122,25 +357,53 @@ class ConstraintChecker:
             Uinf_adjusted (np.ndarray): Flow speeds.
             Ft (np.ndarray): Thrust forces.
             number_of_turbines (int): Number of turbines.
+            out (np.ndarray, optional): Preallocated array to write the result into.
 
         Returns:
             np.ndarray: Pitch constraint values (must be > 0 to be valid).
         """
-        theta_m = vessel.theta_m
-        Fmoor = (0.25 * vessel.Cd * vessel.height * self.rho * vessel.width * Uinf_adjusted**2 + number_of_turbines * Ft) / np.sin(theta_m)
-        Fdrag = 0.5 * self.rho * vessel.Cd * Uinf_adjusted**2 * vessel.width * vessel.h_s
-        Fbuoy = self.rho * self.g * vessel.VesselVolume
+        Moment_U2, Moment_NFt, Moment_const = self._pitch_coefficients(vessel)
+
+        if out is None:
+            out = np.empty(np.broadcast_shapes(np.shape(Uinf_adjusted), np.shape(Ft)))
+        np.square(Uinf_adjusted, out=out)
+        out *= -Moment_U2
+        out -= (number_of_turbines * Moment_NFt) * Ft
+        out += Moment_const
+        return out
+
+    def designed_pitch_constraint_batch(self, vessel_arrays, Uinf_adjusted, Ft, number_of_turbines):
+        """
+        Calculate pitch constraint values for a sweep of designed vessels in one evaluation.
 
-        MomentEquation = (
-            Fmoor * np.cos(theta_m) * vessel.length / 2 +
-            number_of_turbines * Ft * vessel.height / 2 +
-            Fdrag * (vessel.height / 2 - vessel.h_s / 2) -
-            Fbuoy * (vessel.height / 2 - vessel.h_s / 2)
-        )
+        Args:
+            vessel_arrays (object): Vessel properties as attributes holding 1-D arrays of length V, one entry per
+                candidate (theta_m, Cd, height, width, h_s, length, VesselVolume, Kphi, phi).
+            Uinf_adjusted (np.ndarray): Flow speeds, shape (N,).
+            Ft (np.ndarray): Thrust forces, shape (N,).
+            number_of_turbines (int): Number of turbines.
+
+        Returns:
+            np.ndarray: Pitch constraint values of shape (V, N) (must be > 0 to be valid).
+        """
+        theta_m = np.asarray(vessel_arrays.theta_m)
+        Moment_U2, Moment_NFt, Moment_const = self._designed_pitch_coefficients(vessel_arrays, np.sin(theta_m), np.cos(theta_m))
 
-        return vessel.Kphi * vessel.phi - MomentEquation
+        # Vessel coefficients along axis 0, flow points along axis 1
+        U2 = np.square(Uinf_adjusted)
+        NFt = number_of_turbines * np.asarray(Ft)
+        return Moment_const[:, None] - Moment_U2[:, None] * U2 - Moment_NFt[:, None] * NFt
 
-    def user_defined_pitch_constraint(self, vessel, Uinf_adjusted, Ft, dHub, number_of_turbines):
+    def check_pitch_constraint_batch(self, vessel_arrays, Uinf_adjusted, Ft, number_of_turbines):
+        """
+        Check the pitch constraint for a sweep of designed vessels (see designed_pitch_constraint_batch).
+
+        Returns:
+            np.ndarray: Boolean mask of shape (V,), True where the vessel satisfies the constraint.
+        """
+        return (self.designed_pitch_constraint_batch(vessel_arrays, Uinf_adjusted, Ft, number_of_turbines) > 0).all(axis=1)
+
+    def user_defined_pitch_constraint(self, vessel, Uinf_adjusted, Ft, dHub, number_of_turbines, out=None):
         """
         Calculate pitch constraint for a user-defined vessel.
 
@@ -150,26 +413,21 @@ class ConstraintChecker:
             Ft (np.ndarray): Thrust forces.
             dHub (np.ndarray): Hub depths.
             number_of_turbines (int): Number of turbines.
+            out (np.ndarray, optional): Preallocated array to write the result into.
 
         Returns:
             np.ndarray: Pitch constraint values (must be > 0 to be valid).
         """
-        F_vessel_thrust = 0.5 * self.rho * vessel.Cd * vessel.area * Uinf_adjusted**2
-        F_turbine_thrust = number_of_turbines * Ft
-        F_total = F_vessel_thrust + F_turbine_thrust
+        Moment_U2, moor_arm, Moment_const = self._pitch_coefficients(vessel)
+        turbine_arm = self._turbine_arm(dHub, moor_arm)
 
-        if self.withChain:
-            F_total = F_vessel_thrust  # Only vessel drag for Chain-connected turbines
-
-        ConstraintOut = (
-            vessel.Kphi * vessel.phi -
-            F_turbine_thrust * dHub -
-            F_total * vessel.Xm * np.cos(vessel.theta_m) -
-            F_total * vessel.Zm * np.sin(vessel.theta_m)
-        )
-
-        # plt.plot(ConstraintOut)
-        return ConstraintOut
+        if out is None:
+            out = np.empty(np.broadcast_shapes(np.shape(Uinf_adjusted), np.shape(Ft), np.shape(dHub)))
+        np.square(Uinf_adjusted, out=out)
+        out *= -Moment_U2
+        out -= number_of_turbines * Ft * turbine_arm
+        out += Moment_const
+        return out
 
     def check_pitch_constraint(self, vessel, Uinf_adjusted, Ft, dHub, number_of_turbines):
         """
@@ -185,4 +443,7 @@ class ConstraintChecker:
         Returns:
             bool: True if satisfied, False otherwise.
         """
-        return np.all(self.pitch_constraint(vessel, Uinf_adjusted, Ft, dHub, number_of_turbines) > 0)
\ No newline at end of file
+        def constraint(Uinf_adjusted, Ft, dHub, out):
+            return self.pitch_constraint(vessel, Uinf_adjusted, Ft, dHub, number_of_turbines, out=out)
+
+        return self._check_blockwise(constraint, Uinf_adjusted, Ft, dHub)
\ No newline at end of file
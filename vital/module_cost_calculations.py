@@ -1,19 +1,40 @@
+from collections import namedtuple
 import numpy as np
 from vital.constUnitConvert import ConstantsUnitConversion
 from vital.unit_weight import UnitWeight  # Import the function from the new file
 
 CONVERT = ConstantsUnitConversion()
- 
-# mooring_cable_length_m, 
-# force_vessel_drag_N, 
-# turbine_radius_m, 
-# force_turbine_thrust_N
-# turbine_rated_power_W, 
-# number_of_turbines
-# electrical_cable_length_m
-# vessel_volume_m3
-# BatteryCapacity_kWh
 
+# Conversion factors folded once at import, instead of looked up (and multiplied) on every cost function call
+KE2USD = CONVERT.kE2E * CONVERT.euro2dollar  # Kilo euros to dollars
+_M2KM = CONVERT.m2km
+_M2MILE = CONVERT.m2mile
+_W2MW = CONVERT.W2MW
+_W2KW = CONVERT.W2kW
+_N2MTON = CONVERT.N2mTon
+_N2KN = CONVERT.N2kN
+_HRS2DAYS = CONVERT.hrs2days
+
+# Inputs shared by every cost function, in the order of their positional arguments.
+# Cost functions can be called as cost_function(*params) without building a keyword dict.
+# Design parameters may be scalars or 1D arrays holding a batch of design candidates; forces are
+# time series along the last axis (shape (T,) or (B, T)) and are reduced over time.
+CostParams = namedtuple('CostParams', [
+    'turbine_radius_m',
+    'turbine_rated_power_W',
+    'number_of_turbines',
+    'electrical_cable_length_m',
+    'mooring_cable_length_m',
+    'force_vessel_drag_N',
+    'force_turbine_thrust_N',
+    'vessel_volume_m3',
+    'BatteryCapacity_kWh'
+], defaults=(None, None))
+
+
+def _max_abs(force_N):
+    """Largest magnitude along the last (time) axis, without building an np.abs temporary."""
+    return np.maximum(np.max(force_N, axis=-1), -np.min(force_N, axis=-1))
 
 def calculate_electrical_cable_cost(turbine_radius_m, 
                                     turbine_rated_power_W, 
@@ -25,10 +46,10 @@ def calculate_electrical_cable_cost(turbine_radius_m,
                                     vessel_volume_m3=None, 
                                     BatteryCapacity_kWh=None):
     # Lopez table 7
-    electrical_cable_length_km = electrical_cable_length_m * CONVERT.m2km
-    system_total_power_MW = number_of_turbines * turbine_rated_power_W * CONVERT.W2MW
-    electrical_cable_cost_kE = 50.0 * electrical_cable_length_km * system_total_power_MW**0.5
-    electrical_cable_cost_USD = electrical_cable_cost_kE * CONVERT.kE2E * CONVERT.euro2dollar
+    electrical_cable_length_km = electrical_cable_length_m * _M2KM
+    system_total_power_MW = number_of_turbines * turbine_rated_power_W * _W2MW
+    electrical_cable_cost_kE = 50.0 * electrical_cable_length_km * np.sqrt(system_total_power_MW)
+    electrical_cable_cost_USD = electrical_cable_cost_kE * KE2USD
     return electrical_cable_cost_USD
 
 def calculate_mooring_cost(turbine_radius_m, 
@@ -41,9 +62,11 @@ def calculate_mooring_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Lopez table 6
-    mooring_force_mTon = np.max(np.abs(force_vessel_drag_N + number_of_turbines * force_turbine_thrust_N)) * CONVERT.N2mTon
-    mooring_cost_kE = 2 * mooring_cable_length_m * (60.0   + 0.25 * mooring_force_mTon) * 10**-3 
-    mooring_cost_USD = mooring_cost_kE * CONVERT.kE2E * CONVERT.euro2dollar
+    # Forces are time series (last axis); number_of_turbines may hold one value per design candidate
+    mooring_force_N = force_vessel_drag_N + np.asarray(number_of_turbines)[..., np.newaxis] * force_turbine_thrust_N
+    mooring_force_mTon = _max_abs(mooring_force_N) * _N2MTON
+    mooring_cost_kE = 2e-3 * mooring_cable_length_m * (60.0 + 0.25 * mooring_force_mTon)
+    mooring_cost_USD = mooring_cost_kE * KE2USD
     return mooring_cost_USD
 
 def calculate_grid_connection_cost(turbine_radius_m, 
@@ -56,9 +79,9 @@ def calculate_grid_connection_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Lopez table 7
-    turbine_rated_power_MW = turbine_rated_power_W * number_of_turbines * CONVERT.W2MW
-    grid_connection_cost_kE = 20.0 * turbine_rated_power_MW 
-    grid_connection_cost_USD = grid_connection_cost_kE * CONVERT.kE2E * CONVERT.euro2dollar
+    system_total_power_MW = number_of_turbines * turbine_rated_power_W * _W2MW
+    grid_connection_cost_kE = 20.0 * system_total_power_MW
+    grid_connection_cost_USD = grid_connection_cost_kE * KE2USD
     return grid_connection_cost_USD
 
 def calculate_blade_cost(turbine_radius_m, 
@@ -71,9 +94,9 @@ def calculate_blade_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Lopez table 14
-    force_turbine_thrust_kN = np.max(np.abs(force_turbine_thrust_N)) * CONVERT.N2kN
+    force_turbine_thrust_kN = _max_abs(force_turbine_thrust_N) * _N2KN
     blade_cost_kE = number_of_turbines * 0.004 * force_turbine_thrust_kN * (2 * turbine_radius_m)
-    blade_cost_USD = blade_cost_kE * CONVERT.kE2E * CONVERT.euro2dollar
+    blade_cost_USD = blade_cost_kE * KE2USD
     return blade_cost_USD
 
 def calculate_generator_cost(turbine_radius_m, 
@@ -86,9 +109,9 @@ def calculate_generator_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Lopez table 14
-    turbine_rated_power_kW = turbine_rated_power_W * CONVERT.W2kW
+    turbine_rated_power_kW = turbine_rated_power_W * _W2KW
     generator_cost_kE = number_of_turbines * 0.39 * turbine_rated_power_kW**0.8
-    generator_cost_USD = generator_cost_kE * CONVERT.kE2E * CONVERT.euro2dollar
+    generator_cost_USD = generator_cost_kE * KE2USD
     return generator_cost_USD
 
 def calculate_misc_cost(turbine_radius_m, 
@@ -101,10 +124,10 @@ def calculate_misc_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Additional electrical components cost (based on Lopez table 6)
-    turbine_rated_power_MW = turbine_rated_power_W * number_of_turbines * CONVERT.W2MW
-    switchgear_cable_cost_kE = 8.0 * turbine_rated_power_MW
-    control_rectifier_cost_kE = 25.0 * turbine_rated_power_MW
-    misc_cost_USD = (control_rectifier_cost_kE + switchgear_cable_cost_kE) * CONVERT.kE2E * CONVERT.euro2dollar
+    # Every component is proportional to the system power, so their rates (kE per MW) are summed
+    # at compile time: control and rectifier 25.0, switchgear and cable 8.0
+    system_total_power_MW = number_of_turbines * turbine_rated_power_W * _W2MW
+    misc_cost_USD = (25.0 + 8.0) * system_total_power_MW * KE2USD
     return misc_cost_USD
 
 def calculate_hub_cost(turbine_radius_m, 
@@ -117,12 +140,10 @@ def calculate_hub_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Farm hub platform costs (based on Lopez table 7)
-    turbine_rated_power_MW = turbine_rated_power_W * number_of_turbines * CONVERT.W2MW
-    hub_switchgear_cable_cost_kE  = 10.0 * turbine_rated_power_MW
-    hub_converter_cost_kE  = 50.0 * turbine_rated_power_MW
-    hub_offshore_substation_cost_kE  = 80.0 * turbine_rated_power_MW
-    hub_other_systems_cost_kE  = 8.0 * turbine_rated_power_MW
-    hub_cost_USD = (hub_switchgear_cable_cost_kE + hub_converter_cost_kE + hub_offshore_substation_cost_kE + hub_other_systems_cost_kE) * CONVERT.kE2E * CONVERT.euro2dollar
+    # Every component is proportional to the system power, so their rates (kE per MW) are summed
+    # at compile time: switchgear and cable 10.0, converter 50.0, offshore substation 80.0, other systems 8.0
+    system_total_power_MW = number_of_turbines * turbine_rated_power_W * _W2MW
+    hub_cost_USD = (10.0 + 50.0 + 80.0 + 8.0) * system_total_power_MW * KE2USD
     return hub_cost_USD
 
 def calculate_cable_installation_cost(turbine_radius_m, 
@@ -135,13 +156,13 @@ def calculate_cable_installation_cost(turbine_radius_m,
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
     # Cable installation cost (based on Lopez table 7)
-    electrical_cable_length_mile = electrical_cable_length_m * CONVERT.m2mile
-    cable_installation_cost_kE = 120.0 * (electrical_cable_length_mile / (4.1 / 24) + electrical_cable_length_mile / 2.3 + electrical_cable_length_mile / 8.6) * CONVERT.hrs2days
-    cable_installation_cost_USD = cable_installation_cost_kE * CONVERT.kE2E * CONVERT.euro2dollar
+    electrical_cable_length_mile = electrical_cable_length_m * _M2MILE
+    cable_installation_cost_kE = 120.0 * (electrical_cable_length_mile / (4.1 / 24) + electrical_cable_length_mile / 2.3 + electrical_cable_length_mile / 8.6) * _HRS2DAYS
+    cable_installation_cost_USD = cable_installation_cost_kE * KE2USD
     return cable_installation_cost_USD
 
 # Sitkana Cost
-# Unit cost
+# Unit cost (quadratics in Horner form, a*x**2 + b*x + c = (a*x + b)*x + c)
 def calculate_rotor_cost_SITKANA(turbine_radius_m, 
                             turbine_rated_power_W, 
                             number_of_turbines, 
@@ -155,7 +176,7 @@ def calculate_rotor_cost_SITKANA(turbine_radius_m,
     # rotor_cost_USD_perUnit = 280*turbine_radius_m**2 + 409.43*turbine_radius_m - 186.00
 
     # Large Scale
-    rotor_cost_USD_perUnit = 5.58*turbine_radius_m**2 + 8.26*turbine_radius_m -3.75
+    rotor_cost_USD_perUnit = (5.58*turbine_radius_m + 8.26)*turbine_radius_m - 3.75
     rotor_cost_USD = rotor_cost_USD_perUnit*number_of_turbines
     return rotor_cost_USD 
 
@@ -185,7 +206,7 @@ def calculate_steel_component_cost_SITKANA(turbine_radius_m,
                             force_turbine_thrust_N, 
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
-    steel_component_cost_USD_perUnit = 42.86*turbine_radius_m**2 + 261.43*turbine_radius_m - 31.25
+    steel_component_cost_USD_perUnit = (42.86*turbine_radius_m + 261.43)*turbine_radius_m - 31.25
     steel_component_cost_USD = steel_component_cost_USD_perUnit*number_of_turbines
     return steel_component_cost_USD 
 
@@ -198,7 +219,7 @@ def calculate_generator_cost_SITKANA(turbine_radius_m,
                             force_turbine_thrust_N, 
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
-    generator_cost_USD_perUnit = -2.20e-06*turbine_rated_power_W**2 + 2.12e-01*turbine_rated_power_W + 1.42e+02
+    generator_cost_USD_perUnit = (-2.20e-06*turbine_rated_power_W + 2.12e-01)*turbine_rated_power_W + 1.42e+02
     generator_cost_USD = generator_cost_USD_perUnit*number_of_turbines
     return generator_cost_USD 
 
@@ -211,7 +232,7 @@ def calculate_assembly_cost_SITKANA(turbine_radius_m,
                             force_turbine_thrust_N, 
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
-    assembly_cost_USD_perUnit = -4.40e-07*turbine_rated_power_W**2 + 4.23e-02*turbine_rated_power_W + 1.28e+02
+    assembly_cost_USD_perUnit = (-4.40e-07*turbine_rated_power_W + 4.23e-02)*turbine_rated_power_W + 1.28e+02
     assembly_cost_USD = assembly_cost_USD_perUnit*number_of_turbines
     return assembly_cost_USD 
 
@@ -224,7 +245,7 @@ def calculate_concrete_cost_SITKANA(turbine_radius_m,
                             force_turbine_thrust_N, 
                             vessel_volume_m3=None, 
                             BatteryCapacity_kWh=None):
-    concrete_cost_USD_perUnit = 6.65e-09*turbine_rated_power_W**2 + 5.15e-03*turbine_rated_power_W + 8.46e-01
+    concrete_cost_USD_perUnit = (6.65e-09*turbine_rated_power_W + 5.15e-03)*turbine_rated_power_W + 8.46e-01
     concrete_cost_USD = concrete_cost_USD_perUnit*number_of_turbines
     return concrete_cost_USD 
 
@@ -279,6 +300,16 @@ def calculate_charge_controller_cost_SITKANA(turbine_radius_m,
 #     PlasticDensity = 1000
 #     return vessel_volume_m3 * PlasticDensity * 10.0
 
+# Platform volume mapping used by calculate_platform_cost_SITKANA, evaluated once at import
+_PLATFORM_DENSITY = 1020 # density of platform given by Lance is 1020 (?)
+_PLATFORM_VOLUME_NEW_MIN = 0.049019608 # np.min(df['Platform Volume (m3)'])
+_PLATFORM_VOLUME_NEW_MAX = 3.921568627 # np.max(df['Platform Volume (m3)'])
+_PLATFORM_VOLUME_OLD_MIN = 0.012327232416666669 # np.min(total_weight_vector/1020)
+_PLATFORM_VOLUME_OLD_MAX = 0.36467610084313723 # np.max(total_weight_vector/1020)
+_PLATFORM_VOLUME_SCALE = (_PLATFORM_VOLUME_NEW_MAX - _PLATFORM_VOLUME_NEW_MIN) / (_PLATFORM_VOLUME_OLD_MAX - _PLATFORM_VOLUME_OLD_MIN)
+_PLATFORM_COST_A = 3426.95
+_PLATFORM_COST_B = 0.43
+
 def calculate_platform_cost_SITKANA(turbine_radius_m, 
                             turbine_rated_power_W, 
                             number_of_turbines, 
@@ -290,17 +321,10 @@ def calculate_platform_cost_SITKANA(turbine_radius_m,
                             BatteryCapacity_kWh=None):
 
     total_weight = UnitWeight(turbine_radius_m, turbine_rated_power_W)
-    platformVolume = total_weight/1020 # for neutral buoyancy
-    # density of platform given by Lance is 1020 (?)
-    new_min = 0.049019608 # np.min(df['Platform Volume (m3)'])
-    new_max = 3.921568627 # np.max(df['Platform Volume (m3)'])
-    old_min = 0.012327232416666669 # np.min(total_weight_vector/1020)
-    old_max = 0.36467610084313723 # np.max(total_weight_vector/1020)
-    platformVolume_adjusted = new_min + ((platformVolume - old_min) / (old_max - old_min)) * (new_max - new_min)
-
-    a = 3426.95
-    b = 0.43
-    cost = a * platformVolume_adjusted**b
+    platformVolume = total_weight/_PLATFORM_DENSITY # for neutral buoyancy
+    platformVolume_adjusted = _PLATFORM_VOLUME_NEW_MIN + (platformVolume - _PLATFORM_VOLUME_OLD_MIN) * _PLATFORM_VOLUME_SCALE
+
+    cost = _PLATFORM_COST_A * platformVolume_adjusted**_PLATFORM_COST_B
     return cost
 
 def calculate_anchor_cost_SITKANA(turbine_radius_m, 
@@ -1,4 +1,5 @@
 from vital.module_cost_calculations import (
+    CostParams,
     calculate_blade_cost,
     calculate_generator_cost,
     calculate_electrical_cable_cost,
@@ -68,3 +69,29 @@ COST_FUNCTIONS = {
         }
     }
 }
+
+# Flat (cost name, cost function) sequence for each (customer, application), built once from COST_FUNCTIONS:
+# rotor and drivetrain costs followed by the application-specific costs
+COST_FUNCTION_ITEMS = {
+    (customer, application): tuple(config['rotor_and_drivetrain'].items()) + tuple(application_costs.items())
+    for customer, config in COST_FUNCTIONS.items()
+    for application, application_costs in config['applications'].items()
+}
+
+# Development cost as a fraction of the summed costs, for the customers that include it (HDPS)
+DEVELOPMENT_COST_FRACTION = {'customer_A': 0.05}
+
+def total_cost_batch(customer, application, **arrays):
+    """
+    Total cost of a customer and application for a batch of design candidates, as LCOE.calculate_total_capex.
+
+    The keyword arguments are the CostParams fields. Design parameters may be 1D arrays with one entry per
+    candidate and forces arrays of shape (candidates, time), so every cost function is called once for the
+    whole batch. Returns the total cost in USD including development cost, one value per candidate.
+    """
+    params = CostParams(**arrays)
+    total_cost_USD = 0.0
+    for _, cost_function in COST_FUNCTION_ITEMS[(customer, application)]:
+        total_cost_USD += cost_function(*params)
+    total_cost_USD *= 1 + DEVELOPMENT_COST_FRACTION.get(customer, 0.0)
+    return total_cost_USD
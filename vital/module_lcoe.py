@@ -1,9 +1,8 @@
 import numpy as np
-import scipy as sp
 from vital.constGlobal import ConstantsGlobal
 from vital.constUnitConvert import ConstantsUnitConversion
-from vital.module_cost_config import COST_FUNCTIONS
-from vital.module_cost_calculations import operating_cost_SITKANA
+from vital.module_cost_config import COST_FUNCTIONS, COST_FUNCTION_ITEMS, DEVELOPMENT_COST_FRACTION
+from vital.module_cost_calculations import CostParams, operating_cost_SITKANA
 
 # Initialize global constants from modules
 GLOBAL = ConstantsGlobal()
@@ -14,7 +13,7 @@ class LCOE:
     # def __init__(self, turbine_radius, turbine_rated_power, number_of_turbines, hub_depth, 
     #              lifetime=20, discount_rate=0.01, turbulence_intensity=0, customer='customer_A', application='grid_connection'):
     def __init__(self, turbine_radius, turbine_rated_power, number_of_turbines, hub_depth, 
-                 lifetime, discount_rate, turbulence_intensity, customer, application):
+                 lifetime, discount_rate, turbulence_intensity, customer, application, verbose=False):
         self.turbine_radius = turbine_radius
         self.turbine_rated_power = turbine_rated_power
         self.number_of_turbines = number_of_turbines
@@ -24,10 +23,18 @@ class LCOE:
         self.turbulence_intensity = turbulence_intensity
         self.customer = customer
         self.application = application
+        self.verbose = verbose  # Print individual CAPEX components in calculate_lcoe
 
         # Load cost functions based on customer and application configuration
         self.rotor_and_drivetrain_costs = COST_FUNCTIONS[self.customer]['rotor_and_drivetrain']
         self.application_costs = COST_FUNCTIONS[self.customer]['applications'][self.application]
+        self._cost_items = COST_FUNCTION_ITEMS[(self.customer, self.application)]
+
+        # Annuity factor, sum of 1/(1+r)^t for t = 1..lifetime (closed-form geometric series)
+        if self.discount_rate == 0:
+            self._annuity = self.lifetime
+        else:
+            self._annuity = (1 - (1 + self.discount_rate) ** -self.lifetime) / self.discount_rate
 
         # Initialize CAPEX components
         self.capex = {}
@@ -37,19 +44,29 @@ class LCOE:
 
         self.instantaneous_power = None
         self.time_series = None
+        self._annual_energy = None  # Cached result of calculate_annual_energy for the current power series
+
+        # Scaling from single-turbine power to farm power, corrected for turbulence intensity.
+        # The trailing axis lets an array of design candidates scale power series along time.
+        self._power_scale = np.asarray(self.number_of_turbines / (1 + self.turbulence_intensity) ** 3)[..., np.newaxis]
 
     def set_instantaneous_power(self, power_data, time_data):
-        self.instantaneous_power = np.array(power_data) / (1 + self.turbulence_intensity) ** 3 * self.number_of_turbines
-        self.time_series = np.array(time_data)
+        self.instantaneous_power = np.asarray(power_data, dtype=np.float64) * self._power_scale
+        self.time_series = np.asarray(time_data)
+        self._annual_energy = None
 
     def calculate_annual_energy(self):
         if self.instantaneous_power is None or self.time_series is None:
             raise ValueError("Instantaneous power data or time series not set.")
-        
-        dt = np.mean(np.diff(self.time_series))
-        total_energy_generated = sp.integrate.simpson(self.instantaneous_power, dx=dt)  # Total energy in Joules
+
+        # The power series only changes through set_instantaneous_power, so reuse the previous result
+        if self._annual_energy is not None:
+            return self._annual_energy
+
+        total_energy_generated = np.trapezoid(self.instantaneous_power, self.time_series)  # Total energy in Joules
         average_power = total_energy_generated / (self.time_series[-1] - self.time_series[0])  # Average power in watts
         annual_energy = average_power * 8760  / 1000  # Convert to annual energy (kWh)
+        self._annual_energy = annual_energy
         return annual_energy
 
     def calculate_capacity_factor(self):
@@ -78,38 +95,29 @@ class LCOE:
         #     raise ValueError("Battery capacity must be greater than zero for non-grid_connection applications.")
 
 
-        # Common parameters
-        common_params = {
-            'turbine_radius_m': self.turbine_radius,
-            'turbine_rated_power_W': self.turbine_rated_power,
-            'number_of_turbines': self.number_of_turbines,
-            'electrical_cable_length_m': dCable_m,
-            'mooring_cable_length_m': dMoor_m,
-            'force_vessel_drag_N': F_vessel_thrust,
-            'force_turbine_thrust_N': F_turbine_thrust,
-            'vessel_volume_m3': vessel_volume_m3,
-            'BatteryCapacity_kWh': BatteryCapacity_kWh
-        }
-
-        # Calculate rotor and drivetrain costs
-        for cost_name, cost_function in self.rotor_and_drivetrain_costs.items():
-            self.capex[cost_name] = cost_function(**common_params)
-
-        # Calculate application-specific costs
-        for cost_name, cost_function in self.application_costs.items():
-            self.capex[cost_name] = cost_function(**common_params)
-
-        # # Print individual CAPEX components
-        # print("Individual CAPEX components:")
-        # for cost_name, cost_value in self.capex.items():
-        #     print(f"{cost_name}: ${cost_value:.2f}")
-
-        # Sum all CAPEX components
-        total_capex_usd = sum(self.capex.values())
+        # Common parameters, passed positionally to every cost function
+        common_params = CostParams(
+            turbine_radius_m=self.turbine_radius,
+            turbine_rated_power_W=self.turbine_rated_power,
+            number_of_turbines=self.number_of_turbines,
+            electrical_cable_length_m=dCable_m,
+            mooring_cable_length_m=dMoor_m,
+            force_vessel_drag_N=F_vessel_thrust,
+            force_turbine_thrust_N=F_turbine_thrust,
+            vessel_volume_m3=vessel_volume_m3,
+            BatteryCapacity_kWh=BatteryCapacity_kWh
+        )
+
+        # Calculate rotor and drivetrain costs followed by application-specific costs, summing as we go.
+        # With array-valued design parameters each cost function is evaluated once for the whole batch.
+        total_capex_usd = 0.0
+        for cost_name, cost_function in self._cost_items:
+            cost_value = cost_function(*common_params)
+            self.capex[cost_name] = cost_value
+            total_capex_usd += cost_value
         
         # Add development cost (Only for HDPS)
-        if self.customer == 'customer_A':  # HDPS
-            total_capex_usd *= (1 + 0.05)
+        total_capex_usd *= 1 + DEVELOPMENT_COST_FRACTION.get(self.customer, 0.0)
         
         return total_capex_usd, self.capex
 
@@ -125,12 +133,12 @@ class LCOE:
 
     def calculate_present_value_of_costs(self, total_capex, total_opex):
         # Calculate present value of costs
-        pvc = total_capex + total_opex * np.sum([1 / (1 + self.discount_rate)**t for t in range(1, self.lifetime + 1)])
+        pvc = total_capex + total_opex * self._annuity
         return pvc
 
     def calculate_present_value_of_energy(self, annual_energy):
         # Calculate present value of electricity generation
-        pve = annual_energy * np.sum([1 / (1 + self.discount_rate)**t for t in range(1, self.lifetime + 1)])
+        pve = annual_energy * self._annuity
         return pve
 
     def calculate_lcoe(self, dCable_m, 
@@ -160,9 +168,12 @@ class LCOE:
                               BatteryCapacity_kWh)
         
         # Output individual CAPEX components to user
-        print("Individual CAPEX components:")
-        for cost_name, cost_value in capex_components.items():
-            print(f"{cost_name}: ${cost_value:.2f}")
+        if self.verbose:
+            print("Individual CAPEX components:")
+            for cost_name, cost_value in capex_components.items():
+                # Two decimals per value, for a single design or a batch of them
+                cost_str = np.array2string(np.asarray(cost_value, dtype=np.float64), formatter={'float_kind': '{:.2f}'.format})
+                print(f"{cost_name}: ${cost_str}")
         
         # Calculate total OPEX
         total_opex = self.calculate_total_opex(total_capex)
@@ -175,7 +186,7 @@ class LCOE:
         pve = self.calculate_present_value_of_energy(annual_energy)
         
         # Calculate LCOE
-        if pve == 0:
+        if np.any(pve == 0):
             raise ValueError("Present value of energy is zero, cannot calculate LCOE.")
         
         lcoe = pvc / pve
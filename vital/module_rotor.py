@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 import json
 
 class RotorData:
@@ -12,8 +11,8 @@ class RotorData:
         The filename of the rotor data file.
     cpmin_filename : str, optional
         The filename of the Cpmin data file.
-    data : DataFrame
-        The rotor data.
+    data : dict
+        The rotor data columns, keyed by header name.
     tsr : ndarray
         The tip-speed ratio values.
     cp : ndarray
@@ -44,9 +43,9 @@ class RotorData:
         self.filename = filename
         self.cpmin_filename = cpmin_filename
         self.data = self.load_data()
-        self.tsr = self.data['TSR'].values
-        self.cp = self.data['Cp'].values
-        self.ct = self.data['Ct'].values
+        self.tsr = self.data['TSR']
+        self.cp = self.data['Cp']
+        self.ct = self.data['Ct']
         self.cpmin = self.load_cpmin_data()
         self.prepare_data()
         self.CpOpt, self.TSROpt = self.find_max_cp()
@@ -54,14 +53,17 @@ class RotorData:
 
     def load_data(self):
         """
-        Load rotor data from a text file.
+        Load rotor data from a tab-delimited text file with a header row.
 
         Returns
         -------
-        DataFrame
-            The rotor data.
+        dict
+            The rotor data columns, keyed by header name.
         """
-        data = pd.read_csv(self.filename, delimiter='\t')
+        with open(self.filename, 'r') as f:
+            columns = f.readline().strip().split('\t')
+            values = np.loadtxt(f, delimiter='\t', ndmin=2)
+        data = dict(zip(columns, np.ascontiguousarray(values.T)))  # Contiguous array per column
         return data
 
     def load_cpmin_data(self):
@@ -91,6 +93,16 @@ class RotorData:
         self.ct = np.maximum(self.ct, 0)
         self.cpmin = np.minimum(self.cpmin, 0)
 
+        # Linear extrapolation coefficients (slope, intercept) used outside the tabulated TSR range,
+        # fitted once here instead of on every get_cp/get_ct/get_cpmin call
+        self._cp_lo = np.polyfit(self.tsr[:4], self.cp[:4], 1)
+        self._cp_hi = np.polyfit(self.tsr[-4:], self.cp[-4:], 1)
+        self._ct_lo = np.polyfit(self.tsr[:4], self.ct[:4], 1)
+        self._ct_hi = np.polyfit(self.tsr[-4:], self.ct[-4:], 1)
+        self._cpmin_lo = np.polyfit(self.tsr[1:5], self.cpmin[1:5], 1)
+        self._cpmin_lo_scalar = np.polyfit(self.tsr[:4], self.cpmin[:4], 1)  # Scalar queries fit the first 4 points
+        self._cpmin_hi = np.polyfit(self.tsr[-4:], self.cpmin[-4:], 1)
+
     def find_max_cp(self):
         """
         Find the maximum Cp point and the corresponding TSR value.
@@ -133,6 +145,36 @@ class RotorData:
             cq[non_zero_tsr] = self.get_cp(tsr[non_zero_tsr]) / tsr[non_zero_tsr]
             return np.maximum(cq, 0)
 
+    def _interp_extrap(self, tsr, values, tsr_lo, fit_lo, fit_hi, clip):
+        """
+        Interpolate tabulated values over an array of TSR, extrapolating linearly outside the table.
+
+        Parameters
+        ----------
+        tsr : ndarray
+            The tip-speed ratio.
+        values : ndarray
+            The tabulated values at ``self.tsr``.
+        tsr_lo : float
+            TSR below which the lower extrapolation line is used.
+        fit_lo, fit_hi : ndarray
+            (slope, intercept) of the lower and upper extrapolation lines.
+        clip : callable
+            ``np.maximum`` or ``np.minimum``, applied against zero to the extrapolated values.
+
+        Returns
+        -------
+        ndarray
+            The interpolated values.
+        """
+        # Interpolate everywhere in one pass, then overwrite the points outside the table
+        result = np.asarray(np.interp(tsr, self.tsr, values))
+        below = tsr < tsr_lo
+        result[below] = clip(fit_lo[0] * tsr[below] + fit_lo[1], 0)
+        above = tsr > self.tsr[-1]
+        result[above] = clip(fit_hi[0] * tsr[above] + fit_hi[1], 0)
+        return result
+
     def get_cp(self, tsr):
         """
         Interpolate Cp value for a given TSR.
@@ -152,20 +194,14 @@ class RotorData:
                 return np.interp(tsr, self.tsr, self.cp)
             elif tsr < self.tsr[0]:
                 # Linear extrapolation based on the first 4 data points
-                slope, intercept = np.polyfit(self.tsr[:4], self.cp[:4], 1)
+                slope, intercept = self._cp_lo
                 return np.maximum(slope * tsr + intercept, 0)
             else:
                 # Linear extrapolation based on the last 4 data points
-                slope, intercept = np.polyfit(self.tsr[-4:], self.cp[-4:], 1)
+                slope, intercept = self._cp_hi
                 return np.maximum(slope * tsr + intercept, 0)
         else:
-            cp = np.zeros_like(tsr)
-            cp[(tsr <= self.tsr[-1]) & (tsr >= self.tsr[0])] = np.interp(tsr[(tsr <= self.tsr[-1]) & (tsr >= self.tsr[0])], self.tsr, self.cp)
-            slope, intercept = np.polyfit(self.tsr[:4], self.cp[:4], 1)
-            cp[tsr < self.tsr[0]] = np.maximum(slope * tsr[tsr < self.tsr[0]] + intercept, 0)
-            slope, intercept = np.polyfit(self.tsr[-4:], self.cp[-4:], 1)
-            cp[tsr > self.tsr[-1]] = np.maximum(slope * tsr[tsr > self.tsr[-1]] + intercept, 0)
-            return cp
+            return self._interp_extrap(tsr, self.cp, self.tsr[0], self._cp_lo, self._cp_hi, np.maximum)
 
     def get_ct(self, tsr):
         """
@@ -186,20 +222,14 @@ class RotorData:
                 return np.interp(tsr, self.tsr, self.ct)
             elif tsr < self.tsr[0]:
                 # Linear extrapolation based on the first 4 data points
-                slope, intercept = np.polyfit(self.tsr[:4], self.ct[:4], 1)
+                slope, intercept = self._ct_lo
                 return np.maximum(slope * tsr + intercept, 0)
             else:
                 # Linear extrapolation based on the last 4 data points
-                slope, intercept = np.polyfit(self.tsr[-4:], self.ct[-4:], 1)
+                slope, intercept = self._ct_hi
                 return np.maximum(slope * tsr + intercept, 0)
         else:
-            ct = np.zeros_like(tsr)
-            ct[(tsr <= self.tsr[-1]) & (tsr >= self.tsr[0])] = np.interp(tsr[(tsr <= self.tsr[-1]) & (tsr >= self.tsr[0])], self.tsr, self.ct)
-            slope, intercept = np.polyfit(self.tsr[:4], self.ct[:4], 1)
-            ct[tsr < self.tsr[0]] = np.maximum(slope * tsr[tsr < self.tsr[0]] + intercept, 0)
-            slope, intercept = np.polyfit(self.tsr[-4:], self.ct[-4:], 1)
-            ct[tsr > self.tsr[-1]] = np.maximum(slope * tsr[tsr > self.tsr[-1]] + intercept, 0)
-            return ct
+            return self._interp_extrap(tsr, self.ct, self.tsr[0], self._ct_lo, self._ct_hi, np.maximum)
 
     def get_cq(self, tsr):
         """
@@ -236,20 +266,43 @@ class RotorData:
                 return np.interp(tsr, self.tsr, self.cpmin)
             elif tsr < self.tsr[1]:
                 # Linear extrapolation based on the first 4 data points
-                slope, intercept = np.polyfit(self.tsr[:4], self.cpmin[:4], 1)
+                slope, intercept = self._cpmin_lo_scalar
                 return np.minimum(slope * tsr + intercept, 0)
             else:
                 # Linear extrapolation based on the last 4 data points
-                slope, intercept = np.polyfit(self.tsr[-4:], self.cpmin[-4:], 1)
+                slope, intercept = self._cpmin_hi
                 return np.minimum(slope * tsr + intercept, 0)
         else:
-            cpmin = np.zeros_like(tsr)
-            cpmin[(tsr <= self.tsr[-1]) & (tsr >= self.tsr[1])] = np.interp(tsr[(tsr <= self.tsr[-1]) & (tsr >= self.tsr[1])], self.tsr, self.cpmin)
-            slope, intercept = np.polyfit(self.tsr[1:5], self.cpmin[1:5], 1)
-            cpmin[tsr < self.tsr[1]] = np.minimum(slope * tsr[tsr < self.tsr[1]] + intercept, 0)
-            slope, intercept = np.polyfit(self.tsr[-4:], self.cpmin[-4:], 1)
-            cpmin[tsr > self.tsr[-1]] = np.minimum(slope * tsr[tsr > self.tsr[-1]] + intercept, 0)
-            return cpmin
+            return self._interp_extrap(tsr, self.cpmin, self.tsr[1], self._cpmin_lo, self._cpmin_hi, np.minimum)
+
+    def _first_zero_tsr(self, values, fit_hi):
+        """
+        Find the first TSR (from the start of the table) where interpolated/extrapolated values become zero.
+
+        Parameters
+        ----------
+        values : ndarray
+            The tabulated values at ``self.tsr`` (already saturated at zero).
+        fit_hi : ndarray
+            (slope, intercept) of the upper extrapolation line.
+
+        Returns
+        -------
+        float
+            The TSR of the first zero, limited to 10 beyond the last tabulated TSR.
+        """
+        tsr_end = self.tsr[-1] + 10  # Search range extends beyond the provided TSR values
+
+        # Values are >= 0, so linear interpolation first reaches zero at a tabulated point
+        zero = np.flatnonzero(values <= 0)
+        if zero.size:
+            return self.tsr[zero[0]]
+
+        # Otherwise, solve the upper extrapolation line for its root
+        slope, intercept = fit_hi
+        if slope < 0:
+            return min(max(-intercept / slope, self.tsr[-1]), tsr_end)
+        return tsr_end
 
     def find_tsr_max(self):
         """
@@ -260,12 +313,8 @@ class RotorData:
         float
             The maximum TSR value where either Cp or Ct first becomes zero.
         """
-        tsr_range = np.linspace(self.tsr[0], self.tsr[-1] + 10, 1000)  # Extend the range beyond the provided TSR values
-        cp_interp = self.get_cp(tsr_range)
-        ct_interp = self.get_ct(tsr_range)
-
-        tsr_cp_zero = tsr_range[np.where(cp_interp <= 0)[0][0]] if np.any(cp_interp <= 0) else tsr_range[-1]
-        tsr_ct_zero = tsr_range[np.where(ct_interp <= 0)[0][0]] if np.any(ct_interp <= 0) else tsr_range[-1]
+        tsr_cp_zero = self._first_zero_tsr(self.cp, self._cp_hi)
+        tsr_ct_zero = self._first_zero_tsr(self.ct, self._ct_hi)
 
         TSRmax = max(tsr_cp_zero, tsr_ct_zero)
         return TSRmax
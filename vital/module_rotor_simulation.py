@@ -1,9 +1,16 @@
+import math
 import numpy as np
 from vital.constGlobal import ConstantsGlobal
 import scipy as sp
 
 from vital.unit_weight import UnitWeight  # Import the function from the new file
 
+# Largest (speed candidates x time steps) grid evaluated at once when sweeping constant speeds
+SPEED_SWEEP_BLOCK_ELEMENTS = 1 << 20
+
+# Alignment of the rows of RotorSimulation._state (one cache line)
+STATE_ALIGN_BYTES = 64
+
 
 class RotorSimulation:
     def __init__(self, config):
@@ -11,8 +18,11 @@ class RotorSimulation:
         self.Prated = config['Prated']
         self.dCable = config['dCable']
         self.dMoor = config['dMoor']
-        self.Uinf = config['Uinf']
-        self.t = config['t']
+        # As arrays, so that lists are accepted for the time series as well
+        self.Uinf = np.asarray(config['Uinf'], dtype=np.float64)
+        self.t = np.asarray(config['t'], dtype=np.float64)
+        self._dt = (self.t[-1] - self.t[0]) / (len(self.t) - 1)  # Mean time step, see mean_time_step
+        self._average_weights = self._trapezoid_average_weights(self.t)  # See time_average_weights
         self.CpFunc = config['CpFunc']
         self.CqFunc = config['CqFunc']
         self.CtFunc = config['CtFunc']
@@ -24,117 +34,249 @@ class RotorSimulation:
         self.control_strategy = config['control_strategy']
         self.attachment_method = config['attachment_method']
         self.turbine_efficiency = config['efficiency']
+        # Optional number of points of uniform TSR tables replacing the per-step CqFunc/CtFunc calls (None: call them)
+        self.tsr_lookup_points = config.get('tsr_lookup_points')
 
         self.GLOBAL = ConstantsGlobal()
         self.Jr = 1000000
         self.M_turbine = UnitWeight(self.Radius, self.Prated)  # Call the imported function
         self.Wturbine = self.M_turbine * self.GLOBAL.g
+        self._invW = 1.0 / self.Wturbine  # For the cable angle, tan(theta) = Ft / Wturbine
+
+        # Rotor constants shared by the torque, thrust and power calculations
+        self._A = np.pi * self.Radius**2  # Swept area
+        self._half_rho_A = 0.5 * self.GLOBAL.rho * self._A
+        self._half_rho_A_R = self._half_rho_A * self.Radius
         self.Kopt = self.calculate_Kopt()
 
+        # Per-step Cq and Ct evaluation, either the configured functions or lookups in tables sampled from them
+        if self.tsr_lookup_points:
+            self._step_Cq = self._tsr_lookup(self.CqFunc)
+            self._step_Ct = self._tsr_lookup(self.CtFunc)
+        else:
+            self._step_Cq = self.CqFunc
+            self._step_Ct = self.CtFunc
+
         self.initialize_results()
 
         if self.control_strategy == 'constant_speed':
             self.optimal_speed = self.find_optimal_constant_speed()
+            print(f'Optimal Speed is {self.optimal_speed}')  # Reported once here rather than from the time loop
+
+        if self.attachment_method != 'cable':
+            # Only the cable lets the hub depth follow the thrust; otherwise the flow speed at the hub is known
+            # for the whole time series up front. Fill the state rows in place (theta_turbine stays zero)
+            self.dHub[:] = self.dCable
+            self.Uinf_adjusted[:] = self.flowAtDepth(self.Uinf, self.Radius, self.dHub, self.dMoor)
+
+    def mean_time_step(self, t):
+        """
+        Mean time step of t, i.e. np.mean(np.diff(t)); the differences telescope, so no diff array is needed.
+        Reuses the value computed for the simulation time series.
+        """
+        if t is self.t:
+            return self._dt
+        return (t[-1] - t[0]) / (len(t) - 1)
 
-        if self.attachment_method == 'solid_bar':
-            self.theta_turbine = np.zeros(np.shape(self.t))
-            self.dHub = np.ones(np.shape(self.t)) * self.dCable
-            self.Uinf_adjusted = self.flowAtDepth(self.Uinf, self.Radius, self.dHub, self.dMoor)
+    def time_average_weights(self, t):
+        """
+        Weights w such that power @ w equals np.trapezoid(power, t) / (len(t) * mean_time_step(t)), the average
+        power of the objective. Reuses the weights computed for the simulation time series.
+        """
+        if t is self.t:
+            return self._average_weights
+        return self._trapezoid_average_weights(t)
+
+    def _trapezoid_average_weights(self, t):
+        h = np.diff(t)
+        w = np.empty(len(t))
+        w[0] = 0.5 * h[0]
+        w[1:-1] = 0.5 * (h[:-1] + h[1:])
+        w[-1] = 0.5 * h[-1]
+        return w / (len(t) * self.mean_time_step(t))
 
     def initialize_results(self):
-        self.w = np.zeros(np.shape(self.t))
-        self.wd = np.zeros(np.shape(self.t))
-        self.TSR = np.zeros(np.shape(self.t))
-        self.Tc = np.zeros(np.shape(self.t))
-        self.Th = np.zeros(np.shape(self.t))
-        self.Tbrake = np.zeros(np.shape(self.t))
-        self.Ft = np.zeros(np.shape(self.t))
-        self.Uinf_adjusted = np.zeros(np.shape(self.t))
-        self.dHub = np.zeros(np.shape(self.t))
-        self.theta_turbine = np.zeros(np.shape(self.t))
+        # One zeroed (10, len(t)) buffer holding every time series, one row each; the attributes are row views.
+        # Every row starts on a cache-line (STATE_ALIGN_BYTES) boundary, padding the row stride as needed
+        n = len(self.t)
+        align = STATE_ALIGN_BYTES // np.dtype(np.float64).itemsize
+        stride = -(-n // align) * align
+        buffer = np.zeros(10 * stride + align)
+        offset = (-buffer.ctypes.data % STATE_ALIGN_BYTES) // buffer.itemsize
+        self._state = buffer[offset:offset + 10 * stride].reshape(10, stride)[:, :n]
+        (self.w, self.wd, self.TSR, self.Tc, self.Th, self.Tbrake, self.Ft,
+         self.Uinf_adjusted, self.dHub, self.theta_turbine) = self._state
 
     def simulate(self):
-        dt = np.mean(np.diff(self.t))
+        dt = self._dt
 
-        for kk in range(len(self.t)):
-            if self.attachment_method == 'cable':
-                self.adjust_hub_depth(kk)
-
-            if self.control_strategy == 'optimal':
-                self.simulate_optimal_control(kk, dt)
-            elif self.control_strategy == 'constant_speed':
-                self.simulate_constant_speed(kk, dt)
-                # print('This is constant speed')
+        if self.control_strategy in ('optimal', 'constant_speed'):
+            self.simulate_time_loop(dt)
+        else:
+            for kk in range(len(self.t)):
+                if self.attachment_method == 'cable':
+                    self.adjust_hub_depth(kk)
 
         self.calculate_power()
 
-    def adjust_hub_depth(self, kk):
-        if kk == 0:
-            self.dHub[kk] = self.dCable
-            self.theta_turbine[kk] = 0
-        else:
-            self.theta_turbine[kk] = np.arctan(self.Ft[kk-1] / self.Wturbine)
-            self.dHub[kk] = self.dCable * np.cos(self.theta_turbine[kk])
-
-        self.Uinf_adjusted[kk] = self.flowAtDepth(self.Uinf[kk], self.Radius, self.dHub[kk], self.dMoor)
+    def simulate_time_loop(self, dt):
+        """
+        Time loop of the optimal and constant speed control strategies, with the hub depth of adjust_hub_depth for
+        the cable attachment (for other attachments Uinf_adjusted is precomputed in __init__).
 
-    def simulate_optimal_control(self, kk, dt):
+        The forward-Euler recurrence is inherently sequential (and with a cable the hub depth, hence the flow speed,
+        follows the thrust of the previous step), so instead of indexing the result arrays at every step it keeps
+        the state in Python floats and local variables and writes the arrays once at the end. The control law of
+        each step is _control_step, shared with simulate_optimal_control / simulate_constant_speed.
+        """
+        optimal = self.control_strategy == 'optimal'
+        cable = self.attachment_method == 'cable'
+        control_step = self._control_step
+        Radius = self.Radius
+        dCable = self.dCable
+        dMoor = self.dMoor
+        invW = self._invW
+        flowAtDepth = self.flowAtDepth
+
+        Uinf = (self.Uinf if cable else self.Uinf_adjusted).tolist()
+        n = len(Uinf)
+        w_all = [0.0] * n
+        TSR_all = [0.0] * n
+        Th_all = [0.0] * n
+        Tc_all = [0.0] * n
+        Tbrake_all = [0.0] * n
+        Ft_all = [0.0] * n
+        wd_all = [0.0] * n
+        if cable:
+            U_all = [0.0] * n
+            dHub_all = [0.0] * n
+            theta_all = [0.0] * n
+
+        w = wd = Ft = 0.0
+        for kk in range(n):
+            U = Uinf[kk]
+            if cable:
+                # See adjust_hub_depth: the cable angle follows the thrust of the previous step
+                if kk == 0:
+                    dHub = dCable
+                    theta = 0.0
+                else:
+                    theta = math.atan(Ft * invW)
+                    dHub = dCable * math.cos(theta)
+                U = flowAtDepth(U, Radius, dHub, dMoor)
+                U_all[kk] = U
+                dHub_all[kk] = dHub
+                theta_all[kk] = theta
+
+            w, TSR, Th, Tc, Tbrake, Ft, wd = control_step(optimal, kk, U, w, wd, dt)
+
+            w_all[kk] = w
+            TSR_all[kk] = TSR
+            Th_all[kk] = Th
+            Tc_all[kk] = Tc
+            Tbrake_all[kk] = Tbrake
+            Ft_all[kk] = Ft
+            wd_all[kk] = wd
+
+        self.w[:] = w_all
+        self.TSR[:] = TSR_all
+        self.Th[:] = Th_all
+        self.Tc[:] = Tc_all
+        self.Tbrake[:] = Tbrake_all
+        self.Ft[:] = Ft_all
+        self.wd[:] = wd_all
+        if cable:
+            self.Uinf_adjusted[:] = U_all
+            self.dHub[:] = dHub_all
+            self.theta_turbine[:] = theta_all
+
+    def _control_step(self, optimal, kk, U, w_prev, wd_prev, dt):
+        """
+        One forward-Euler step of the optimal (optimal=True) or constant speed control, on scalars.
+        Returns (w, TSR, Th, Tc, Tbrake, Ft, wd) of step kk from the flow speed at the hub U and the state of step kk-1.
+        """
         if kk == 0:
-            self.w[kk] = self.TSROpt * self.Uinf_adjusted[kk] / self.Radius
+            w = self.TSROpt * U / self.Radius if optimal else self.optimal_speed
         else:
-            self.w[kk] = self.w[kk-1] + self.wd[kk-1] * dt
+            w = w_prev + wd_prev * dt
 
-        if self.Uinf_adjusted[kk] != 0:
-            self.TSR[kk] = min(self.w[kk] * self.Radius / self.Uinf_adjusted[kk], self.TSRmax)
+        if U != 0:
+            TSR = min(w * self.Radius / U, self.TSRmax)
         else:
-            self.TSR[kk] = 0
+            TSR = 0
 
-        self.Th[kk] = self.calculate_hydro_torque(self.Radius, self.Uinf_adjusted[kk], self.CqFunc(self.TSR[kk]))
-        self.Tc[kk] = self.Kopt * self.w[kk]**2
+        Th = self._half_rho_A_R * U**2 * self._step_Cq(TSR)  # Hydrodynamic torque
+        Tc = self.Kopt * w**2 if optimal else Th  # Constant speed: required to keep speed constant
 
-        if self.Tc[kk] * self.w[kk] * self.turbine_efficiency > self.Prated:
-            self.Tc[kk] = (self.Prated / self.turbine_efficiency) / self.w[kk]
+        if Tc * w * self.turbine_efficiency > self.Prated:
+            Tc = (self.Prated / self.turbine_efficiency) / w
 
-        if self.Uinf_adjusted[kk] < self.Umin:
-            self.Tc[kk] = 0
+        if U < self.Umin:
+            Tc = 0
 
+        Tbrake = 0.0
         if self.withBrake:
-            self.Tbrake[kk] = (self.w[kk]**2 * self.Kopt) - self.Tc[kk]
+            Tbrake = (w**2 * self.Kopt) - Tc if optimal else Th - Tc
 
-        self.Ft[kk] = self.calculate_thrust_force(self.Radius, self.Uinf_adjusted[kk], self.CtFunc(self.TSR[kk]))
+        Ft = self._half_rho_A * U**2 * self._step_Ct(TSR)  # Thrust force
+        wd = 1 / self.Jr * (Th - Tc - Tbrake)
+        return w, TSR, Th, Tc, Tbrake, Ft, wd
 
-        self.wd[kk] = 1 / self.Jr * (self.Th[kk] - self.Tc[kk] - self.Tbrake[kk])
+    def _store_control_step(self, optimal, kk, dt):
+        w_prev = self.w[kk-1] if kk > 0 else 0.0
+        wd_prev = self.wd[kk-1] if kk > 0 else 0.0
+        (self.w[kk], self.TSR[kk], self.Th[kk], self.Tc[kk], self.Tbrake[kk], self.Ft[kk],
+         self.wd[kk]) = self._control_step(optimal, kk, self.Uinf_adjusted[kk], w_prev, wd_prev, dt)
 
-    def simulate_constant_speed(self, kk, dt):
+    def adjust_hub_depth(self, kk):
         if kk == 0:
-            self.w[kk] = self.optimal_speed
-            print(f'Optimal Speed is {self.optimal_speed}')
-        else:
-            self.w[kk] = self.w[kk-1] + self.wd[kk-1] * dt
-
-        if self.Uinf_adjusted[kk] != 0:
-            self.TSR[kk] = min(self.w[kk] * self.Radius / self.Uinf_adjusted[kk], self.TSRmax)
+            self.dHub[kk] = self.dCable
+            self.theta_turbine[kk] = 0
         else:
-            self.TSR[kk] = 0
-
-        self.Th[kk] = self.calculate_hydro_torque(self.Radius, self.Uinf_adjusted[kk], self.CqFunc(self.TSR[kk]))
-        self.Tc[kk] = self.Th[kk]  # Required to keep speed constant
+            # Scalar math functions, avoiding NumPy ufunc dispatch at every time step
+            theta = math.atan(self.Ft[kk-1] * self._invW)
+            self.theta_turbine[kk] = theta
+            self.dHub[kk] = self.dCable * math.cos(theta)
 
-        if self.Tc[kk] * self.w[kk] * self.turbine_efficiency > self.Prated:
-            self.Tc[kk] = (self.Prated / self.turbine_efficiency) / self.w[kk]
+        self.Uinf_adjusted[kk] = self.flowAtDepth(self.Uinf[kk], self.Radius, self.dHub[kk], self.dMoor)
 
-        if self.Uinf_adjusted[kk] < self.Umin:
-            self.Tc[kk] = 0
+    def simulate_optimal_control(self, kk, dt):
+        # Step kk of the optimal control, for callers stepping the simulation themselves (see simulate_time_loop)
+        self._store_control_step(True, kk, dt)
 
-        if self.withBrake:
-            self.Tbrake[kk] = self.Th[kk] - self.Tc[kk]
+    def simulate_constant_speed(self, kk, dt):
+        # Step kk of the constant speed control, for callers stepping the simulation themselves (see simulate_time_loop)
+        self._store_control_step(False, kk, dt)
 
-        self.Ft[kk] = self.calculate_thrust_force(self.Radius, self.Uinf_adjusted[kk], self.CtFunc(self.TSR[kk]))
+    def _tsr_lookup(self, func):
+        """
+        Build a scalar function that linearly interpolates func in a table sampled once on a uniform TSR grid
+        over [0, TSRmax] (tsr_lookup_points points); TSR values outside the grid are passed to func.
 
-        self.wd[kk] = 1 / self.Jr * (self.Th[kk] - self.Tc[kk] - self.Tbrake[kk])
+        The table is stored as Python floats so that a lookup is an index computation and two list reads,
+        much cheaper per time step than calling func on a scalar. Resolution is set by tsr_lookup_points.
+        """
+        n = int(self.tsr_lookup_points)
+        if n < 2:
+            raise ValueError("tsr_lookup_points must be at least 2.")
+        tsr_end = float(self.TSRmax)
+        grid = np.linspace(0.0, tsr_end, n)
+        table = [float(func(tsr)) for tsr in grid]  # Scalar calls, as in the time loop
+        table.append(table[-1])  # Lets TSR == TSRmax interpolate without a bounds check
+        inv_dx = (n - 1) / tsr_end
+
+        def lookup(tsr):
+            if 0.0 <= tsr <= tsr_end:
+                x = tsr * inv_dx
+                i = int(x)
+                f = x - i
+                return table[i] + (table[i + 1] - table[i]) * f
+            return func(tsr)
+
+        return lookup
 
     def calculate_Kopt(self):
-        return 0.5 * self.GLOBAL.rho * (np.pi * self.Radius**2) * self.Radius**3 * self.CpOpt / self.TSROpt**3
+        return self._half_rho_A * self.Radius**3 * self.CpOpt / self.TSROpt**3
 
     def calculate_hydro_torque(self, Radius, Uinf, Cq):
         return 0.5 * self.GLOBAL.rho * (np.pi * Radius**2) * Radius * Uinf**2 * Cq
@@ -143,10 +285,10 @@ class RotorSimulation:
         return 0.5 * self.GLOBAL.rho * (np.pi * Radius**2) * Uinf**2 * Ct
 
     def calculate_phydro(self, Uinf, Cp):
-        return 0.5 * self.GLOBAL.rho * (np.pi * self.Radius**2) * Uinf**3 * Cp
+        return self._half_rho_A * Uinf**3 * Cp
 
     def calculate_pfluid(self):
-        return 0.5 * self.GLOBAL.rho * (np.pi * self.Radius**2) * self.Uinf_adjusted**3
+        return self._half_rho_A * self.Uinf_adjusted**3
 
     def calculate_punc(self):
         return self.Kopt * (self.Uinf_adjusted * self.TSROpt / self.Radius)**3
@@ -158,11 +300,14 @@ class RotorSimulation:
         return self.w * self.Tc * self.turbine_efficiency
 
     def calculate_power(self):
-        self.Phydro = self.calculate_phydro(self.Uinf_adjusted, self.CpFunc(self.TSR))
-        self.Pfluid = self.calculate_pfluid()
-        self.Punc = self.calculate_punc()
-        self.Pmech = self.calculate_pmech()
-        self.Pelec = self.calculate_pelec()
+        # As the calculate_p* methods, sharing intermediates instead of recomputing them: Uinf_adjusted**3 feeds
+        # Pfluid, Phydro and Punc (with the Kopt*(TSROpt/R)**3 factor folded), Pfluid and Pmech are scaled into Phydro and Pelec
+        U3 = self.Uinf_adjusted**3
+        self.Pfluid = self._half_rho_A * U3
+        self.Phydro = self.Pfluid * self.CpFunc(self.TSR)
+        self.Punc = np.multiply(U3, self.Kopt * (self.TSROpt / self.Radius)**3, out=U3)
+        self.Pmech = self.w * self.Tc
+        self.Pelec = self.Pmech * self.turbine_efficiency
 
     def get_results(self):
         return {
@@ -198,49 +343,89 @@ class RotorSimulation:
         - Uout: Adjusted flow speed at the hub depth in m/s.
         """
         if np.isscalar(FlowSpeed):
-            FlowSpeed = np.array([FlowSpeed])
-            dHub = np.array([dHub])
-
-        Uout = np.zeros_like(FlowSpeed)
-        Area = np.pi * Radius ** 2.0
-        Uavg = FlowSpeed / 1.07
-        dz = dMoor - dHub
-
-        for i in range(len(FlowSpeed)):
-            if (dz[i] - Radius) < 0.5 * dMoor and (dz[i] + Radius) <= 0.5 * dMoor:
-                Za = dz[i] - Radius
-                Zb = dz[i] + Radius
+            # Single sample (one time step of the cable attachment): choose the limits with plain comparisons
+            dz = dMoor - dHub
+            if (dz - Radius) < 0.5 * dMoor and (dz + Radius) <= 0.5 * dMoor:
+                Za = dz - Radius
+                Zb = dz + Radius
                 Zc = Zd = 0.0
-            elif (dz[i] - Radius) >= 0.5 * dMoor and (dz[i] + Radius) > 0.5 * dMoor:
+            elif (dz - Radius) >= 0.5 * dMoor and (dz + Radius) > 0.5 * dMoor:
                 Za = Zb = 0.0
-                Zc = dz[i] - Radius
-                Zd = dz[i] + Radius
+                Zc = dz - Radius
+                Zd = dz + Radius
             else:
-                Za = dz[i] - Radius
+                Za = dz - Radius
                 Zb = Zc = 0.5 * dMoor
-                Zd = dz[i] + Radius
+                Zd = dz + Radius
+            return self._depth_averaged_speed(FlowSpeed / 1.07, Radius, dMoor, Za, Zb, Zc, Zd)
 
-            tempvalA = (1.1407 * (1 / dMoor) ** (3 / 7) * Uavg[i] ** 3.0 * (Zb ** (10 / 7) - Za ** (10 / 7)))
-            tempvalB = (1.07 * Uavg[i]) ** 3.0 * (Zd - Zc)
-            PfluidAvg = 1 / (4.0 * Radius) * self.GLOBAL.rho * Area * (tempvalA + tempvalB)
-            Uout[i] = ((2.0 * PfluidAvg) / (self.GLOBAL.rho * Area)) ** (1 / 3.0)
+        Uout = np.zeros_like(FlowSpeed)
+        Uavg = FlowSpeed / 1.07
+        dz = dMoor - dHub
 
+        # Integration limits for every sample at once: [Za, Zb] in the upper (power-law) half of the water column
+        # and [Zc, Zd] in the lower (uniform) half; a rotor spanning the middle uses both
+        half = 0.5 * dMoor
+        Zlo = dz - Radius
+        Zhi = dz + Radius
+        upper = (Zlo < half) & (Zhi <= half)
+        lower = (Zlo >= half) & (Zhi > half)
+        Za = np.where(lower, 0.0, Zlo)
+        Zb = np.where(upper, Zhi, np.where(lower, 0.0, half))
+        Zc = np.where(upper, 0.0, np.where(lower, Zlo, half))
+        Zd = np.where(upper, 0.0, Zhi)
+
+        Uout[:] = self._depth_averaged_speed(Uavg, Radius, dMoor, Za, Zb, Zc, Zd)
         return Uout if len(Uout) > 1 else Uout[0]
 
+    def _depth_averaged_speed(self, Uavg, Radius, dMoor, Za, Zb, Zc, Zd):
+        """
+        Speed with the same fluid power as the depth profile over the rotor (see flowAtDepth), for scalars or arrays.
+        """
+        Area = np.pi * Radius ** 2.0
+        tempvalA = (1.1407 * (1 / dMoor) ** (3 / 7) * Uavg ** 3.0 * (Zb ** (10 / 7) - Za ** (10 / 7)))
+        tempvalB = (1.07 * Uavg) ** 3.0 * (Zd - Zc)
+        PfluidAvg = 1 / (4.0 * Radius) * self.GLOBAL.rho * Area * (tempvalA + tempvalB)
+        return ((2.0 * PfluidAvg) / (self.GLOBAL.rho * Area)) ** (1 / 3.0)
+
     def objectiveFunction_findOptimalConstantSpeed(self, x, radius, Uinf, t, CpFunc):
         speed = x
         TSR = np.divide(speed * radius, Uinf, out=np.zeros_like(Uinf), where=Uinf!=0)  # Avoid division by zero
         TSR = np.minimum(TSR, self.TSRmax)  # Cap TSR at TSRmax
         power = self.calculate_phydro(Uinf, CpFunc(TSR))
-        avg_power = np.trapezoid(power, t) / (len(t) * np.mean(np.diff(t)))  # Calculate average power
+        avg_power = power @ self.time_average_weights(t)  # Calculate average power (trapezoid rule)
         return -1 * avg_power  # Negative because we are maximizing power
 
+    def average_power_constant_speeds(self, speeds, radius, Uinf, t, CpFunc):
+        """
+        Average hydrodynamic power for each of several constant rotor speeds (the negated objective of
+        objectiveFunction_findOptimalConstantSpeed, evaluated for all speeds at once).
+
+        Speeds are processed in blocks of rows of a (speeds, time) grid, so CpFunc is called once per block
+        while memory use stays bounded for long time series.
+        """
+        speeds = np.asarray(speeds, dtype=float)
+        Uinf = np.asarray(Uinf)
+        nonzero = Uinf != 0
+        weights = self.time_average_weights(t)
+        avg_power = np.empty(speeds.shape)
+        block = max(1, SPEED_SWEEP_BLOCK_ELEMENTS // max(Uinf.size, 1))
+        for start in range(0, speeds.size, block):
+            speed = speeds[start:start + block, np.newaxis]
+            TSR = np.divide(speed * radius, Uinf, out=np.zeros((speed.shape[0], Uinf.size)), where=nonzero)  # Avoid division by zero
+            TSR = np.minimum(TSR, self.TSRmax)  # Cap TSR at TSRmax
+            power = self.calculate_phydro(Uinf, CpFunc(TSR))
+            avg_power[start:start + block] = power @ weights
+        return avg_power
+
     def find_optimal_constant_speed(self):
-        possibleSpeed = self.TSROpt * self.Uinf / self.Radius  # Assuming optimal TSR condition, what is the speed range
-        possibleSpeedRange = np.linspace(np.min(possibleSpeed), np.max(possibleSpeed), 50)  # Initial guess range
+        # Assuming optimal TSR condition, what is the speed range (scaling is monotonic, so scale the extreme flow speeds only)
+        possibleSpeedMin = self.TSROpt * np.min(self.Uinf) / self.Radius
+        possibleSpeedMax = self.TSROpt * np.max(self.Uinf) / self.Radius
+        possibleSpeedRange = np.linspace(possibleSpeedMin, possibleSpeedMax, 50)  # Initial guess range
 
         # If we kept the constant speed candidate in possibleSpeedRange, what is the potential average power
-        avePowerRange = -1 * np.array([self.objectiveFunction_findOptimalConstantSpeed(ii, self.Radius, self.Uinf, self.t, self.CpFunc) for ii in possibleSpeedRange])
+        avePowerRange = self.average_power_constant_speeds(possibleSpeedRange, self.Radius, self.Uinf, self.t, self.CpFunc)
         
         # What is the range of constant speed where we can get positive average power
         # This is for defining the bounds of the optimization
@@ -1,9 +1,11 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import math
-import datetime
-import calendar
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from scipy.interpolate import PchipInterpolator
 import pandas as pd
@@ -21,21 +23,51 @@ EARTH_RADIUS_M = 6378137.0
 MIN_FLOW_SPEED = 1e-4
 DEFAULT_MOORING_DISTANCE_M = 50.0
 
+@lru_cache(maxsize=8)
+def _load_cities(citytextfile: str) -> tuple:
+    """
+    Reads a city list (name, latitude, longitude in degrees) once per file.
+    Returns the city names, the latitudes/longitudes in radians and the cosine of the latitudes
+    as arrays shared by all callers.
+    """
+    datafile = pd.read_table(citytextfile, delimiter=",", comment='#')
+    city_name = datafile.iloc[:, 0].to_numpy()
+    city_lat = np.radians(datafile.iloc[:, 1].to_numpy(dtype=np.float64))
+    city_lon = np.radians(datafile.iloc[:, 2].to_numpy(dtype=np.float64))
+    city_cos_lat = np.cos(city_lat)
+    return city_name, city_lat, city_lon, city_cos_lat
+
+@lru_cache(maxsize=16)
+def _time_grid(range_hrs: int, time_step_s: float) -> np.ndarray:
+    """
+    Simulation time grid [0, range_hrs) in steps of time_step_s, shared by TidalData objects with the same settings.
+    The array is read-only because it is shared.
+    """
+    time_s = np.arange(0, range_hrs * 3600.0, time_step_s)
+    time_s.flags.writeable = False
+    return time_s
+
 class TidalData:
     """
     A class to represent tidal data.
     ...
     """
 
-    def __init__(self, station: str, startdate: str, range_hrs: int, time_step_s: float):
+    def __init__(self, station: str, startdate: str, range_hrs: int, time_step_s: float, interp_kind: str = 'pchip'):
         """
         Constructs all the necessary attributes for the TidalData object.
         ...
+        interp_kind selects how the NOAA predictions are resampled onto the simulation time grid:
+        'pchip' (shape-preserving cubic, default) or 'linear' (cheaper for small time steps).
         """
+        if interp_kind not in ('pchip', 'linear'):
+            raise ValueError(f"Unknown interp_kind '{interp_kind}', expected 'pchip' or 'linear'.")
         self.station: str = station
         self.startdate: str = startdate
         self.range_hrs: int = range_hrs
         self.time_step_s: float = time_step_s
+        self.interp_kind: str = interp_kind
+        self._is_pct: bool = station.lower().startswith('pct')  # PCT stations report signed Velocity_Major and no deployments
         self.flow_speeds_m_s: np.ndarray = None
         self.time_s: np.ndarray = None
         self.mooring_distance_m: float = None
@@ -45,6 +77,10 @@ class TidalData:
         self.nearest_city: str = None
         self.electrical_cable_length_m: float = None
         self.session = requests.Session()  # Use a session for requests
+        # Keep verified HTTPS connections to NOAA pooled (one per concurrent request) and retry transient failures
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self._station_json: dict = None  # Station metadata, fetched once and shared by get_station_name/get_station_info
 
     def __del__(self):
         """Ensure the session is closed when the object is deleted."""
@@ -55,13 +91,10 @@ class TidalData:
         Retrieves the name of the station.
         ...
         """
-        url = f'{NOAA_API_BASE_URL}/{self.station}.json'
+        input_data = self.get_station_info()
         try:
-            req_data = self.session.get(url, verify=False)
-            req_data.raise_for_status()  # Raise an error for bad responses
-            input_data = req_data.json()
             return input_data['stations'][0]['name']
-        except (requests.RequestException, KeyError) as e:
+        except KeyError as e:
             print(f"Error retrieving station name: {e}")
             return None
 
@@ -70,11 +103,16 @@ class TidalData:
         Retrieves information about the station.
         ...
         """
+        # The station metadata does not change, so only the first call goes to the network
+        if self._station_json is not None:
+            return self._station_json
+
         url = f"{NOAA_API_BASE_URL}/{self.station}.json"
         try:
-            req_data = self.session.get(url, verify=False)
+            req_data = self.session.get(url)
             req_data.raise_for_status()
-            return req_data.json()
+            self._station_json = req_data.json()
+            return self._station_json
         except (requests.RequestException, KeyError) as e:
             print(f"Error retrieving station info: {e}")
             return {}
@@ -86,7 +124,7 @@ class TidalData:
         """
         url = f"{NOAA_API_BASE_URL}/{self.station}/deployments.json"
         try:
-            req_data = self.session.get(url, verify=False)
+            req_data = self.session.get(url)
             req_data.raise_for_status()
             return req_data.json()
         except (requests.RequestException, KeyError) as e:
@@ -102,22 +140,22 @@ class TidalData:
         url = (f'{NOAA_TIDAL_DATA_URL}?station={self.station}&begin_date={self.startdate}&range={range_hrs_extended}'
                f'&product=currents_predictions&units=metric&time_zone=gmt&interval=1&vel_type=speed_dir&format=json')
         try:
-            req_data = self.session.get(url, verify=False)
+            req_data = self.session.get(url)
             req_data.raise_for_status()
             return req_data.json()
         except (requests.RequestException, KeyError) as e:
             print(f"Error retrieving tidal data: {e}")
             return {}
 
-    def extract_tidal_speed(self, input_data: dict) -> list:
+    def extract_tidal_speed(self, input_data: dict) -> np.ndarray:
         """
         Extracts tidal speed data from the input data.
         ...
         """
-        if self.station.lower().startswith('pct'):
-            return [x['Velocity_Major'] for x in input_data['current_predictions']['cp']]
-        else:
-            return [x['Speed'] for x in input_data['current_predictions']['cp']]
+        predictions = input_data['current_predictions']['cp']
+        key = 'Velocity_Major' if self._is_pct else 'Speed'
+        # 'Speed' is delivered as a string, so convert to float while building the array
+        return np.fromiter((float(x[key]) for x in predictions), dtype=np.float64, count=len(predictions))
 
     def extract_tidal_time(self, input_data: dict) -> list:
         """
@@ -125,18 +163,23 @@ class TidalData:
         ...
         """
         tidal_time_string = [x['Time'] for x in input_data['current_predictions']['cp']]
-        date_obj = [datetime.datetime.strptime(x, '%Y-%m-%d %H:%M') for x in tidal_time_string]
-        return [calendar.timegm(x.timetuple()) for x in date_obj]
+        # Parse all timestamps in one call (times are GMT) and convert to seconds since the epoch
+        date_obj = pd.to_datetime(tidal_time_string, format='%Y-%m-%d %H:%M', utc=True)
+        return ((date_obj - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(seconds=1)).tolist()
 
-    def distance(self, lat1: float, lat2: float, lon1: float, lon2: float) -> float:
+    def distance(self, lat1: float, lat2: float, lon1: float, lon2: float, cos_lat2: np.ndarray = None) -> float:
         """
         Calculates the great-circle distance between two points on the Earth.
         ...
+        cos_lat2 optionally supplies a precomputed cos(lat2), e.g. cached for a fixed list of points.
         """
+        # NumPy ufuncs so that lat2/lon2 may also be arrays of points
+        if cos_lat2 is None:
+            cos_lat2 = np.cos(lat2)
         dlon = lon2 - lon1
         dlat = lat2 - lat1
-        a = math.sin(dlat / 2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2)**2
-        c = 2 * math.asin(math.sqrt(a))
+        a = np.sin(dlat / 2)**2 + np.cos(lat1) * cos_lat2 * np.sin(dlon / 2)**2
+        c = 2 * np.arcsin(np.sqrt(a))
         return c * EARTH_RADIUS_M
 
     def calCableLen(self, buoylat: float, buoylon: float, citytextfile: str) -> tuple:
@@ -144,23 +187,14 @@ class TidalData:
         Calculates the cable length from a buoy to the closest city listed in a text file.
         ...
         """
-        datafile = pd.read_table(citytextfile, delimiter=",", comment='#')
-        d_cable_len = np.zeros(len(datafile))
-        
-        for ind in datafile.index:
-            city_lat = math.radians(datafile[datafile.columns[1]][ind])
-            city_lon = math.radians(datafile[datafile.columns[2]][ind])
-
-            d_cable_len[ind] = self.distance(buoylat, city_lat, buoylon, city_lon)
-
-        closestCity = datafile[datafile.columns[0]][np.argmin(d_cable_len)]
-        cableLen_m = round(d_cable_len[np.argmin(d_cable_len)], 2)
-        # print(f'City lat:{datafile[datafile.columns[1]][np.argmin(d_cable_len)]} degree')
-        # print(f'City lon:{datafile[datafile.columns[2]][np.argmin(d_cable_len)]} degree')
-        # print(f'City lat:{math.radians(datafile[datafile.columns[1]][np.argmin(d_cable_len)])} radian')
-        # print(f'City lon:{math.radians(datafile[datafile.columns[2]][np.argmin(d_cable_len)])} radian')
-        # print(f'Buoy lat:{buoylat} radian')
-        # print(f'Buoy lon:{buoylon} radian')
+        city_name, city_lat, city_lon, city_cos_lat = _load_cities(citytextfile)
+
+        # Great-circle distance to every city in one pass, reusing the cached cos(city_lat)
+        d_cable_len = self.distance(buoylat, city_lat, buoylon, city_lon, cos_lat2=city_cos_lat)
+
+        i_closest = np.argmin(d_cable_len)
+        closestCity = city_name[i_closest]
+        cableLen_m = round(d_cable_len[i_closest], 2)
         return cableLen_m, closestCity
 
     def load_tidal_data(self, city_data_file: str) -> tuple:
@@ -168,9 +202,15 @@ class TidalData:
         Loads tidal data and calculates the necessary attributes.
         ...
         """
-        self.station_name = self.get_station_name()
+        # The NOAA requests are independent, so issue them concurrently and wait on all round-trips at once
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            executor.submit(self.get_station_info)
+            tidal_future = executor.submit(self.get_tidal_data)
+            if not self._is_pct:
+                deployment_future = executor.submit(self.get_deployment_info)
+        self.station_name = self.get_station_name()  # Read from the station metadata fetched above
 
-        if self.station.lower().startswith('pct'):
+        if self._is_pct:
             input_data = self.get_station_info()
             self.buoy_latitude_rad = math.radians(input_data['stations'][0]['lat'])
             self.buoy_longitude_rad = math.radians(input_data['stations'][0]['lng'])
@@ -178,7 +218,7 @@ class TidalData:
             # print(f'Buoy lon:{float(input_data['stations'][0]['lng'])} degree')
             self.mooring_distance_m = DEFAULT_MOORING_DISTANCE_M
         else:
-            input_data = self.get_deployment_info()
+            input_data = deployment_future.result()
             self.mooring_distance_m = float(input_data['depth'])
             if input_data['units'] == 'feet':
                 self.mooring_distance_m *= CONVERT.ft2m
@@ -188,17 +228,20 @@ class TidalData:
             # print(f'Buoy lon:{float(input_data['deployments'][0]['lng'])} degree')
 
 
-        tidal_data = self.get_tidal_data()
+        tidal_data = tidal_future.result()
         tidal_speed_cms = self.extract_tidal_speed(tidal_data)
         tidal_time_s = np.array(self.extract_tidal_time(tidal_data))
-        tidal_speed_ms = np.array([float(x) for x in tidal_speed_cms]) * CONVERT.cms2ms
-
-        tidal_CubicSpline = PchipInterpolator(tidal_time_s - tidal_time_s[0], tidal_speed_ms)
-        end_time = self.range_hrs * 3600.0
-        self.time_s = np.arange(0, end_time, self.time_step_s)
-        self.flow_speeds_m_s = tidal_CubicSpline(self.time_s)
-        self.flow_speeds_m_s = np.abs(self.flow_speeds_m_s)
-        self.flow_speeds_m_s = np.maximum(self.flow_speeds_m_s, MIN_FLOW_SPEED)
+        tidal_speed_ms = tidal_speed_cms * CONVERT.cms2ms
+
+        self.time_s = _time_grid(self.range_hrs, self.time_step_s)  # Shared, read-only
+        if self.interp_kind == 'linear':
+            self.flow_speeds_m_s = np.interp(self.time_s, tidal_time_s - tidal_time_s[0], tidal_speed_ms)
+        else:
+            tidal_CubicSpline = PchipInterpolator(tidal_time_s - tidal_time_s[0], tidal_speed_ms)
+            self.flow_speeds_m_s = tidal_CubicSpline(self.time_s)
+        # Flow speed magnitude, floored at MIN_FLOW_SPEED, computed in place on the resampled buffer
+        np.abs(self.flow_speeds_m_s, out=self.flow_speeds_m_s)
+        np.maximum(self.flow_speeds_m_s, MIN_FLOW_SPEED, out=self.flow_speeds_m_s)
 
         self.electrical_cable_length_m, self.nearest_city = self.calCableLen(self.buoy_latitude_rad, self.buoy_longitude_rad, city_data_file)
 
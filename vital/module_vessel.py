@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from vital.constGlobal import ConstantsGlobal
 GLOBAL = ConstantsGlobal()
@@ -42,6 +43,10 @@ class VesselData:
         Submerged height; Half of the vessel height.
     """
 
+    # Fixed attribute layout (no per-instance __dict__); Xm, Zm and area are only set for some vessels
+    __slots__ = ('height', 'density', 'theta_m', 'alpha', 'Cd', 'phi', 'user_defined', 'vessel_properties',
+                 'width', 'Fmoor', 'length', 'Khs', 'Kphi', 'GM', 'VesselVolume', 'h_s', 'Xm', 'Zm', 'area')
+
     def __init__(self, height=None, density=None, theta_m=None, alpha=None, Cd=None, phi=None, user_defined=False, vessel_properties=None):
         """
         Constructs all the necessary attributes for the VesselData object.
@@ -72,7 +77,7 @@ class VesselData:
         self.Cd = Cd
         self.phi = phi
         self.user_defined = user_defined
-        self.vessel_properties = vessel_properties or {}
+        self.vessel_properties = vessel_properties if vessel_properties is not None else {}
 
         self.width = None
         self.Fmoor = None
@@ -150,16 +155,23 @@ class VesselData:
         rho = GLOBAL.rho
         g = GLOBAL.g
 
-        U = np.max(Uinf)
+        i_max = np.argmax(Uinf)  # Design point is the peak flow speed
+        U = Uinf[i_max]
         total_mass_of_turbines = mass_of_turbines * number_of_turbines
-        total_turbine_thrust_force = Ft[np.argmax(Uinf)] * number_of_turbines
-        width_temp = height * (height * Cd**2 * U**4 * rho**2 * np.cos(theta_m)**2 + 
-                               32 * total_mass_of_turbines * alpha * g**2 * rho * np.sin(theta_m)**2 - 
-                               64 * total_mass_of_turbines * alpha * rho_b * g**2 * np.sin(theta_m)**2 + 
-                               16 * total_turbine_thrust_force * alpha * np.sin(2 * theta_m) * g * rho - 
-                               32 * total_turbine_thrust_force * alpha * rho_b * np.sin(2 * theta_m) * g)
-        self.width = 0.25 * (np.sqrt(width_temp) + Cd * U**2 * height * rho * np.cos(theta_m)) / (np.sin(theta_m) * (alpha * g * height * rho - 2 * alpha * g * height * rho_b))
-        self.Fmoor = (0.25 * Cd * height * rho * self.width * U**2 + total_turbine_thrust_force) / np.sin(theta_m)
+        total_turbine_thrust_force = Ft[i_max] * number_of_turbines
+        # Scalar trigonometry evaluated once with math instead of repeated NumPy scalar calls
+        sin_theta = math.sin(theta_m)
+        cos_theta = math.cos(theta_m)
+        sin_2theta = math.sin(2 * theta_m)
+        U2 = U**2
+
+        width_temp = height * (height * Cd**2 * U2**2 * rho**2 * cos_theta**2 + 
+                               32 * total_mass_of_turbines * alpha * g**2 * rho * sin_theta**2 - 
+                               64 * total_mass_of_turbines * alpha * rho_b * g**2 * sin_theta**2 + 
+                               16 * total_turbine_thrust_force * alpha * sin_2theta * g * rho - 
+                               32 * total_turbine_thrust_force * alpha * rho_b * sin_2theta * g)
+        self.width = 0.25 * (np.sqrt(width_temp) + Cd * U2 * height * rho * cos_theta) / (sin_theta * (alpha * g * height * rho - 2 * alpha * g * height * rho_b))
+        self.Fmoor = (0.25 * Cd * height * rho * self.width * U2 + total_turbine_thrust_force) / sin_theta
         self.length = self.alpha * self.width
         self.Khs = rho * g * self.width * self.length
         self.VesselVolume = self.width * self.length * height
@@ -194,8 +206,9 @@ class VesselData:
         """
         Print all attributes of the VesselData object.
         """
-        for attribute, value in vars(self).items():
-            print(f"{attribute}: {value}")
+        for attribute in self.__slots__:
+            if hasattr(self, attribute):
+                print(f"{attribute}: {getattr(self, attribute)}")
 
 
     # def calculate_mooring_force(self, Uinf, Ft):
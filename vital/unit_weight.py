@@ -1,16 +1,28 @@
 # unit_weight.py
 
+# Fitted coefficients of the rotor weight (kg) as a quadratic in the radius (m)
+ROTOR_WEIGHT_R2 = 11.19999928
+ROTOR_WEIGHT_R1 = 16.37714233
+ROTOR_WEIGHT_R0 = -7.44
+
+# Fitted coefficients of the PTO weight (kg) as a linear function of the rated power (kW)
+PTO_WEIGHT_P1 = 0.01501693
+PTO_WEIGHT_P0 = 1.51674108
+
+# Constant term of UnitWeight, the sum of the rotor and PTO constant terms
+UNIT_WEIGHT_C0 = ROTOR_WEIGHT_R0 + PTO_WEIGHT_P0
+
 def RotorWeight(Radius):
     """
     Calculate the weight of the rotor based on its radius.
 
     Parameters:
-        Radius (float): The radius of the rotor in meters.
+        Radius (float or ndarray): The radius of the rotor in meters.
 
     Returns:
-        float: The calculated weight of the rotor in kilograms.
+        float or ndarray: The calculated weight of the rotor in kilograms.
     """
-    Weight = 11.19999928 * Radius**2 + 16.37714233 * Radius - 7.44
+    Weight = ROTOR_WEIGHT_R2 * Radius**2 + ROTOR_WEIGHT_R1 * Radius + ROTOR_WEIGHT_R0
     return Weight
 
 def PTOWeight(Prated):
@@ -18,12 +30,12 @@ def PTOWeight(Prated):
     Calculate the weight of the PTO (Power Take-Off) based on its rated power.
 
     Parameters:
-        Prated (float): The rated power of the PTO in kilowatts.
+        Prated (float or ndarray): The rated power of the PTO in kilowatts.
 
     Returns:
-        float: The calculated weight of the PTO in kilograms.
+        float or ndarray: The calculated weight of the PTO in kilograms.
     """
-    Weight = 0.01501693 * Prated + 1.51674108
+    Weight = PTO_WEIGHT_P1 * Prated + PTO_WEIGHT_P0
     return Weight
 
 def UnitWeight(Radius, Prated):
@@ -31,11 +43,12 @@ def UnitWeight(Radius, Prated):
     Calculate the total unit weight by summing the rotor weight and PTO weight.
 
     Parameters:
-        Radius (float): The radius of the rotor in meters.
-        Prated (float): The rated power of the PTO in kilowatts.
+        Radius (float or ndarray): The radius of the rotor in meters.
+        Prated (float or ndarray): The rated power of the PTO in kilowatts.
 
     Returns:
-        float: The total unit weight in kilograms.
+        float or ndarray: The total unit weight in kilograms.
     """
-    Weight = RotorWeight(Radius) + PTOWeight(Prated)
+    # RotorWeight(Radius) + PTOWeight(Prated) as one polynomial, with the two constant terms combined
+    Weight = ROTOR_WEIGHT_R2 * Radius * Radius + ROTOR_WEIGHT_R1 * Radius + PTO_WEIGHT_P1 * Prated + UNIT_WEIGHT_C0
     return Weight
\ No newline at end of file